@@ -1,27 +1,17 @@
 """Halp CLI."""
 
+from collections.abc import Callable
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Annotated, Optional
 
 import peewee
 import typer
 from loguru import logger
 
-# isort:skip
-from halper.commands import (
-    categorize_command,
-    category_display,
-    command_display,
-    command_list,
-    edit_command_description,
-    hide_commands,
-    list_hidden_commands,
-    search_commands,
-    unhide_commands,
-)
 from halper.config import HalpConfig
 from halper.constants import DB, STATE_DIR, VERSION, SearchType
-from halper.models import Database, Indexer
+from halper.models import Database
 from halper.utils import (
     check_python_version,
     console,
@@ -46,8 +36,116 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def parse_command_ids(value: str | None) -> tuple[int, ...] | None:
+    """Convert a comma-separated string of command IDs to a tuple of unique integers.
+
+    Runs when options are parsed so malformed IDs fail before the database is touched. Duplicate IDs
+    are dropped, keeping the order in which they were first given.
+
+    Args:
+        value (str | None): Comma-separated command IDs, e.g. "234,456".
+
+    Returns:
+        tuple[int, ...] | None: The unique command IDs, or None if no value was given.
+
+    Raises:
+        typer.BadParameter: If any ID is not an integer.
+    """
+    if not value:
+        return None
+
+    try:
+        return tuple(dict.fromkeys(int(x) for x in value.split(",")))
+    except ValueError as e:
+        msg = f"Invalid command ID in '{value}'. Use comma separated integers: 234,456"
+        raise typer.BadParameter(msg) from e
+
+
+# Command handlers. Each imports its command when run to keep startup fast. Commands exit the
+# application when they complete.
+def _list_hidden(opts: SimpleNamespace) -> None:
+    from halper.commands.hidden_commands import list_hidden_commands  # noqa: PLC0415
+
+    list_hidden_commands(full_output=opts.full_output, only_exports=opts.only_exports)
+    raise typer.Exit(0)
+
+
+def _hide(opts: SimpleNamespace) -> None:
+    from halper.commands.hidden_commands import hide_commands  # noqa: PLC0415
+
+    hide_commands(opts.ids_to_hide)
+
+
+def _unhide(opts: SimpleNamespace) -> None:
+    from halper.commands.hidden_commands import unhide_commands  # noqa: PLC0415
+
+    unhide_commands(opts.ids_to_unhide)
+
+
+def _edit_description(opts: SimpleNamespace) -> None:
+    from halper.commands.edit_description import edit_command_description  # noqa: PLC0415
+
+    edit_command_description(opts.edit_description_id)
+
+
+def _categorize(opts: SimpleNamespace) -> None:
+    from halper.commands.categorize_command import categorize_command  # noqa: PLC0415
+
+    categorize_command(opts.categorize)
+
+
+def _search(opts: SimpleNamespace) -> None:
+    from halper.commands.search import search_commands  # noqa: PLC0415
+
+    search_type, pattern = (
+        (SearchType.CODE, opts.search_code)
+        if opts.search_code
+        else (SearchType.NAME, opts.search_name)
+    )
+    search_commands(search_type=search_type, pattern=pattern, full_output=opts.full_output)
+
+
+def _category(opts: SimpleNamespace) -> None:
+    from halper.commands.category_display import category_display  # noqa: PLC0415
+
+    category_display(
+        input_string=HalpConfig().uncategorized_name if opts.uncategorized else opts.input_string,
+        list_categories=opts.show_list,
+        full_output=opts.full_output,
+        only_exports=opts.only_exports,
+    )
+
+
+def _list(opts: SimpleNamespace) -> None:
+    from halper.commands.command_display import command_list  # noqa: PLC0415
+
+    command_list(full_output=opts.full_output, only_exports=opts.only_exports)
+
+
+def _display(opts: SimpleNamespace) -> None:
+    from halper.commands.command_display import command_display  # noqa: PLC0415
+
+    command_display(opts.input_string, full_output=opts.full_output)
+
+
+# Ordered (predicate, handler) pairs, checked in turn against the parsed options.
+_DISPATCH: tuple[
+    tuple[Callable[[SimpleNamespace], object], Callable[[SimpleNamespace], None]], ...
+] = (
+    (lambda o: o.list_hidden, _list_hidden),
+    (lambda o: o.ids_to_hide, _hide),
+    (lambda o: o.ids_to_unhide, _unhide),
+    (lambda o: o.edit_description_id, _edit_description),
+    (lambda o: o.categorize, _categorize),
+    (lambda o: o.search_code or o.search_name, _search),
+    (lambda o: o.category or o.uncategorized, _category),
+    (lambda o: o.show_list, _list),
+    (lambda o: o.input_string, _display),
+)
+
+
 @app.command()
-def main(  # noqa: C901
+def main(
     input_string: Annotated[
         Optional[str],
         typer.Argument(
@@ -80,6 +178,7 @@ def main(  # noqa: C901
         Optional[str],
         typer.Option(
             "--hide",
+            callback=parse_command_ids,
             help="Hide command(s) by ID. [dim]Use comma separator: --hide 234,456",
             show_default=False,
         ),
@@ -109,6 +208,7 @@ def main(  # noqa: C901
         Optional[str],
         typer.Option(
             "--unhide",
+            callback=parse_command_ids,
             help="Unhide command(s) by ID. [dim]Use comma separator: --unhide 234,456",
             show_default=False,
         ),
@@ -229,6 +329,27 @@ def main(  # noqa: C901
 
     validate_config()
 
+    has_action = any(
+        (
+            input_string,
+            category,
+            uncategorized,
+            categorize,
+            edit_description_id,
+            ids_to_hide,
+            ids_to_unhide,
+            list_hidden,
+            show_list,
+            search_code,
+            search_name,
+            index,
+            index_full,
+        )
+    )
+    if not has_action:
+        typer.echo(typer.style("No command specified", fg="red", bold=True))
+        raise typer.Exit(code=1)
+
     # Instantiate Database
     try:
         db = Database(DB)
@@ -237,7 +358,7 @@ def main(  # noqa: C901
         logger.exception(f"Unable to instantiate database: {e}")
         raise typer.Exit(code=1) from e
 
-    if db.is_empty() and (not index and not index_full):
+    if not index and not index_full and db.is_empty():
         console.print(
             "No commands found.\nMake sure your configuration file is up to date and run [code]halp --index[/code] to index your commands."
         )
@@ -245,52 +366,30 @@ def main(  # noqa: C901
 
     # Process options
     if index or index_full:
+        from halper.models import Indexer  # noqa: PLC0415
+
         indexer = Indexer(rebuild=index_full)
         indexer.do_index()
         raise typer.Exit(0)
 
-    if list_hidden:
-        list_hidden_commands(full_output=full_output, only_exports=only_exports)
-        raise typer.Exit(0)
-
-    if ids_to_hide:
-        hide_commands(ids_to_hide)
-
-    if ids_to_unhide:
-        unhide_commands(ids_to_unhide)
-
-    if edit_description_id:
-        edit_command_description(edit_description_id)
-
-    if categorize:
-        categorize_command(categorize)
-
-    if search_code or search_name:
-        # TODO: Testing this function is difficult because of the custom regex function not working in the mocked database
-        search_type, pattern = (
-            (SearchType.CODE, search_code) if search_code else (SearchType.NAME, search_name)
-        )
-        search_commands(search_type=search_type, pattern=pattern, full_output=full_output)
-
-    # If we are working with categories, run those commands
-    if category or uncategorized:
-        category_display(
-            input_string=HalpConfig().uncategorized_name if uncategorized else input_string,
-            list_categories=show_list,
-            full_output=full_output,
-            only_exports=only_exports,
-        )
-
-    # If we are working with commands, run those commands
-    if show_list:
-        command_list(full_output=full_output, only_exports=only_exports)
-
-    if input_string:
-        command_display(input_string, full_output=full_output)
-
-    if not input_string:
-        typer.echo(typer.style("No command specified", fg="red", bold=True))
-        raise typer.Exit(code=1)
+    options = SimpleNamespace(
+        category=category,
+        categorize=categorize,
+        edit_description_id=edit_description_id,
+        full_output=full_output,
+        ids_to_hide=ids_to_hide,
+        ids_to_unhide=ids_to_unhide,
+        input_string=input_string,
+        list_hidden=list_hidden,
+        only_exports=only_exports,
+        search_code=search_code,
+        search_name=search_name,
+        show_list=show_list,
+        uncategorized=uncategorized,
+    )
+    for matches, handler in _DISPATCH:
+        if matches(options):
+            handler(options)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,38 @@
-"""Commands for HALP."""
+"""Commands for HALP.
 
-from .categorize_command import categorize_command
-from .category_display import category_display
-from .command_display import command_display, command_list
-from .edit_description import edit_command_description
-from .hidden_commands import hide_commands, list_hidden_commands, unhide_commands
-from .search import search_commands
+Each command lives in its own submodule which is imported on first attribute access (PEP 562).
+Most invocations run a single command, so the others are never imported.
+
+Several commands share a name with their submodule. Importing such a submodule directly rebinds the
+package attribute to the module, so internal callers import from the submodule itself.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .categorize_command import categorize_command  # noqa: TC004
+    from .category_display import category_display  # noqa: TC004
+    from .command_display import command_display, command_list  # noqa: TC004
+    from .edit_description import edit_command_description  # noqa: TC004
+    from .hidden_commands import (  # noqa: TC004
+        hide_commands,
+        list_hidden_commands,
+        unhide_commands,
+    )
+    from .search import search_commands  # noqa: TC004
+
+_LAZY_ATTRS = {
+    "categorize_command": ".categorize_command",
+    "category_display": ".category_display",
+    "command_display": ".command_display",
+    "command_list": ".command_display",
+    "edit_command_description": ".edit_description",
+    "hide_commands": ".hidden_commands",
+    "list_hidden_commands": ".hidden_commands",
+    "search_commands": ".search",
+    "unhide_commands": ".hidden_commands",
+}
 
 __all__ = [
     "categorize_command",
@@ -18,3 +45,21 @@ __all__ = [
     "search_commands",
     "unhide_commands",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the submodule providing `name` and cache the attribute on this package.
+
+    Returns:
+        Any: The requested attribute.
+
+    Raises:
+        AttributeError: If `name` is not provided by any submodule.
+    """
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
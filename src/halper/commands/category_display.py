@@ -3,8 +3,10 @@
 import peewee
 import typer
 from loguru import logger
+from rich.console import Group
+from rich.text import Text
 
-from halper.models import Category
+from halper.models import Category, Command
 from halper.utils import console
 from halper.views import command_list_table, strings_to_columns
 
@@ -26,16 +28,24 @@ def category_display(
     Raises:
         typer.Exit: Exits the application with a status code. The status code is 1 if either no categories are found, and 0 upon successful completion.
     """
+    categories: list[Category] = []
+    category_names: list[str] = []
     try:
         query = Category.select()
         if input_string:
             query = query.where(Category.name.contains(input_string))
-        categories = query.order_by(Category.name).execute()
+        query = query.order_by(Category.name)
+
+        if list_categories:
+            # Only names are listed, so select just that column and skip building models
+            category_names = [name for (name,) in query.select(Category.name).tuples()]
+        else:
+            categories = list(query)
     except peewee.PeeweeException as e:
         logger.exception(f"Error fetching categories: {e}")
         raise typer.Exit(code=1) from e
 
-    if not list(categories):
+    if not categories and not category_names:
         if input_string:
             console.print(f"No categories found matching: [bold]{input_string}[/bold]")
         else:
@@ -44,22 +54,29 @@ def category_display(
         raise typer.Exit(code=1)
 
     if list_categories:
-        category_names = [category.name for category in categories]
         columns = strings_to_columns(name="category", strings=category_names)
         console.print(columns)
 
         raise typer.Exit()
 
+    # Fetch the commands of every category at once rather than one query per category
+    commands_by_category = Command.by_category([category.id for category in categories])
+
+    tables = []
     for category in categories:
         table = command_list_table(
-            category=category,
+            commands=commands_by_category[category.id],
             full_output=full_output,
             only_exports=only_exports,
-            title=f"[bold underline]{category.name}[/bold underline]\n{category.description}"
+            title=Text.assemble((category.name, "bold underline"), "\n", category.description)
             if category.description
             else category.name,
         )
         if table:
-            console.print(table)
+            tables.append(table)
+
+    # Render every table in a single write rather than one console.print() per category
+    if tables:
+        console.print(Group(*tables))
 
     raise typer.Exit()
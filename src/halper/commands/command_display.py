@@ -10,7 +10,7 @@ from loguru import logger
 
 from halper.constants import CommandType
 from halper.models import Command
-from halper.utils import console, errors, get_mankier_table, get_tldr_command
+from halper.utils import console, errors, get_tldr_command
 from halper.views import command_list_table, display_commands, strings_to_columns
 
 
@@ -28,21 +28,20 @@ def command_list(
         typer.Exit: Exits the application with a status code. The status code is 1 if either no commands are found, and 0 upon successful completion.
     """
     try:
-        query = Command.select()
         if only_exports:
-            query = query.where(
+            conditions = (
                 Command.command_type == CommandType.EXPORT.name,
                 Command.hidden == False,  # noqa: E712
             )
         else:
-            query = query.where(
+            conditions = (
                 Command.command_type != CommandType.EXPORT.name,
                 Command.hidden == False,  # noqa: E712
             )
 
         if full_output:
             table = command_list_table(
-                commands=query.order_by(Command.name),
+                commands=Command.select_with_file().where(*conditions).order_by(Command.name),
                 full_output=full_output,
                 only_exports=only_exports,
                 show_categories=True,
@@ -50,13 +49,14 @@ def command_list(
             console.print(table)
             raise typer.Exit()
 
-        command_names = [command.name for command in query.order_by(Command.name)]
-        if not command_names:
+        # Only the names are displayed, so avoid loading code and descriptions
+        names_query = Command.select(Command.name).where(*conditions).order_by(Command.name)
+        names = [name for (name,) in names_query.tuples().iterator()]
+        if not names:
             console.print("No commands found")
             raise typer.Exit(1)
 
-        columns = strings_to_columns(name="command", strings=command_names)
-        console.print(columns)
+        console.print(strings_to_columns(name="command", strings=names))
 
     except peewee.PeeweeException as e:
         logger.exception(f"Error fetching commands: {e}")
@@ -76,18 +76,24 @@ def command_display(input_string: str, full_output: bool = False) -> None:
         typer.Exit: Exits the application with status code 0 on success, 1 on failure.
     """
     # Check if input_string contains a space
-    if " " in input_string:
+    first_word, space, _ = input_string.partition(" ")
+    if space:
+        # Imported here as it pulls in requests and markdownify, which only this branch needs
+        from halper.utils import get_mankier_table  # noqa: PLC0415
+
         try:
             console.print(get_mankier_table(input_string))
             raise typer.Exit()
         except errors.MankierCommandNotFoundError:
-            input_string = input_string.split(" ")[0]
+            input_string = first_word
 
     tldr = get_tldr_command()
 
     # Attempt to find the command in the database
     try:
-        commands = Command.select().where(Command.name == input_string, Command.hidden == False)  # noqa: E712
+        commands = list(
+            Command.select_with_file().where(Command.name == input_string, Command.hidden == False)  # noqa: E712
+        )
 
         # Check if commands were found in the database
         if commands:
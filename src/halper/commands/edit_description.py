@@ -3,6 +3,7 @@
 import typer
 from loguru import logger
 from rich.prompt import Prompt
+from rich.text import Text
 
 from halper.models import Command
 from halper.utils import console
@@ -30,14 +31,14 @@ def edit_command_description(command_id: int) -> None:
         logger.error(f"No command found with ID {command_id}")
         raise typer.Exit(code=1)
 
-    console.print(f"Editing description for command [code]{command.name}[/code]")
-    console.print(f"Current description: [code]{command.escaped_desc}[/code]")
+    # Text objects are not parsed for markup, so user supplied text needs no escaping
+    console.print(Text.assemble("Editing description for command ", (command.name, "code")))
+    console.print(Text.assemble("Current description: ", (command.description or "", "code")))
     console.rule()
     new_description = Prompt.ask("New description")
 
-    new_description_display = new_description.replace("[", "\\[")
     confirm = Prompt.ask(
-        f"Set description to [code]{new_description_display}[/code]?", choices=["y", "n"]
+        Text.assemble("Set description to ", (new_description, "code"), "?"), choices=["y", "n"]
     )
     if confirm.lower() == "n":
         raise typer.Abort()
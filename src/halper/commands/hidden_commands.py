@@ -1,8 +1,11 @@
 """Hide a command by ID."""
 
+from collections.abc import Sequence
+
 import typer
-from loguru import logger
+from peewee import chunked
 
+from halper.constants import ID_BATCH_SIZE
 from halper.models import Command
 from halper.utils import console
 from halper.views import command_list_table
@@ -22,13 +25,13 @@ def list_hidden_commands(full_output: bool = False, only_exports: bool = False)
     Raises:
         typer.Exit: Always exits after displaying table. Exit code 0 indicates success.
     """
-    commands = Command.select().where(Command.hidden == True).order_by(Command.name)  # noqa: E712
-    if not commands:
+    query = Command.select_with_file().where(Command.hidden == True).order_by(Command.name)  # noqa: E712
+    if not query.exists():
         console.print("No hidden commands")
         raise typer.Exit(code=0)
 
     table = command_list_table(
-        commands=commands,
+        commands=list(query),
         full_output=full_output,
         only_exports=only_exports,
         show_hidden=True,
@@ -40,84 +43,82 @@ def list_hidden_commands(full_output: bool = False, only_exports: bool = False)
     raise typer.Exit(code=0)
 
 
-def unhide_commands(command_ids: str | None = None) -> None:
+def _set_hidden(command_ids: Sequence[int] | None, hidden: bool) -> None:
+    """Set the hidden flag of commands in one transaction and report each change.
+
+    IDs are processed in batches of `ID_BATCH_SIZE` so very long ID lists stay within SQLite's
+    host parameter limit.
+
+    Args:
+        command_ids: Sequence[int] | None - IDs of the commands to update.
+        hidden: bool - The value to set the hidden flag to.
+
+    Raises:
+        typer.Exit: If no IDs were given or a command is not found. Exit code 1.
+    """
+    if not command_ids:
+        console.print("No command ID provided")
+        raise typer.Exit(code=1)
+
+    with Command.atomic():
+        names: dict[int, str] = {}
+        for batch in chunked(command_ids, ID_BATCH_SIZE):
+            names.update(
+                Command.select(Command.id, Command.name).where(Command.id.in_(batch)).tuples()
+            )
+        for idx in command_ids:
+            if idx not in names:
+                console.print(f"Command with ID {idx} not found")
+                raise typer.Exit(code=1)
+
+        for batch in chunked(command_ids, ID_BATCH_SIZE):
+            Command.update(hidden=hidden).where(Command.id.in_(batch)).execute()
+
+    action = "hidden" if hidden else "unhidden"
+    for idx in command_ids:
+        console.print(f"Command {names[idx]} {action}")
+
+
+def unhide_commands(command_ids: Sequence[int] | None = None) -> None:
     """Make previously hidden commands visible again by their IDs.
 
-    Take a comma-separated string of command IDs and make those commands visible in the command list
+    Take a sequence of command IDs and make those commands visible in the command list
     again by setting their hidden flag to False. This allows restoring commands that were previously
     hidden from view.
 
     Args:
-        command_ids: str | None - Comma-separated string of command IDs to unhide (e.g. "1,2,3").
-            If None or invalid, exits with error.
+        command_ids: Sequence[int] | None - IDs of the commands to unhide (e.g. (1, 2, 3)).
+            If None or empty, exits with error.
 
     Raises:
-        typer.Exit: If command_ids is None/invalid, any ID is not an integer, or command not found.
+        typer.Exit: If command_ids is None/empty or a command is not found.
             Exit code 1 indicates error, 0 indicates success.
 
     Example:
-        unhide_commands("1,5,10")  # Makes commands with IDs 1, 5 and 10 visible again
+        unhide_commands((1, 5, 10))  # Makes commands with IDs 1, 5 and 10 visible again
     """
-    if not command_ids or not isinstance(command_ids, str):
-        console.print("No command ID provided")
-        raise typer.Exit(code=1)
-
-    for command_id in command_ids.split(","):
-        try:
-            idx = int(command_id)
-        except ValueError as e:
-            logger.error(f"Invalid command ID: {command_id}")
-            raise typer.Exit(code=1) from e
-
-        try:
-            command = Command.get_by_id(idx)
-            command.hidden = False
-            command.save()
-            console.print(f"Command {command.name} unhidden")
-        except Command.DoesNotExist as e:
-            console.print(f"Command with ID {idx} not found")
-            raise typer.Exit(code=1) from e
-
+    _set_hidden(command_ids, hidden=False)
     raise typer.Exit(code=0)
 
 
-def hide_commands(command_ids: str | None = None) -> None:
+def hide_commands(command_ids: Sequence[int] | None = None) -> None:
     """Hide specified commands from appearing in command listings.
 
-    Take a comma-separated string of command IDs and hide those commands from appearing in command
+    Take a sequence of command IDs and hide those commands from appearing in command
     listings by setting their hidden flag to True. This allows removing commands from view without
     deleting them from the database, useful for decluttering the command list or hiding deprecated
     commands while preserving them.
 
     Args:
-        command_ids: str | None - Comma-separated string of command IDs to hide (e.g. "1,2,3").
-            If None or invalid, exits with error.
+        command_ids: Sequence[int] | None - IDs of the commands to hide (e.g. (1, 2, 3)).
+            If None or empty, exits with error.
 
     Raises:
-        typer.Exit: If command_ids is None/invalid, any ID is not an integer, or command not found.
+        typer.Exit: If command_ids is None/empty or a command is not found.
             Exit code 1 indicates error, 0 indicates success.
 
     Example:
-        hide_commands("1,5,10")  # Hides commands with IDs 1, 5 and 10 from listings
+        hide_commands((1, 5, 10))  # Hides commands with IDs 1, 5 and 10 from listings
     """
-    if not command_ids or not isinstance(command_ids, str):
-        console.print("No command ID provided")
-        raise typer.Exit(code=1)
-
-    for command_id in command_ids.split(","):
-        try:
-            idx = int(command_id)
-        except ValueError as e:
-            logger.error(f"Invalid command ID: {command_id}")
-            raise typer.Exit(code=1) from e
-
-        try:
-            command = Command.get_by_id(idx)
-            command.hidden = True
-            command.save()
-            console.print(f"Command {command.name} hidden")
-        except Command.DoesNotExist as e:
-            console.print(f"Command with ID {idx} not found")
-            raise typer.Exit(code=1) from e
-
+    _set_hidden(command_ids, hidden=True)
     raise typer.Exit(code=0)
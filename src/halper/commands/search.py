@@ -1,9 +1,12 @@
 """Search for commands by name, description, or code."""
 
+import re
+
 import typer
-from peewee import fn
+from peewee import chunked
 
-from halper.constants import CommandType, SearchType
+from halper.config import HalpConfig
+from halper.constants import ID_BATCH_SIZE, CommandType, SearchType
 from halper.models import Command
 from halper.utils import console
 from halper.views import command_list_table
@@ -26,12 +29,29 @@ def search_commands(
         console.print("No search pattern provided.")
         raise typer.Exit(1)
 
-    search_field = Command.name if search_type == SearchType.NAME else Command.code
-    commands = Command.select().where(
-        fn.REGEXP(pattern, search_field), Command.command_type != CommandType.EXPORT.name
-    )
+    try:
+        regex = re.compile(pattern, flags=HalpConfig().regex_flags)
+    except re.error as e:
+        console.print(f"Invalid regex: [code]{pattern}[/code] ({e})")
+        raise typer.Exit(1) from e
 
-    if not commands.exists():
+    # Match in Python against only the searched column, then load full rows for the matches
+    search_field = Command.name if search_type == SearchType.NAME else Command.code
+    matched_ids = [
+        command_id
+        for command_id, text in Command.select(Command.id, search_field)
+        .where(Command.command_type != CommandType.EXPORT.name)
+        .tuples()
+        .iterator()
+        if regex.search(text)
+    ]
+    commands = [
+        command
+        for batch in chunked(matched_ids, ID_BATCH_SIZE)
+        for command in Command.select_with_file().where(Command.id.in_(batch))
+    ]
+
+    if not commands:
         console.print(f"No commands found matching regex: [code]{pattern}[/code]")
         raise typer.Exit(1)
 
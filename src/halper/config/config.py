@@ -1,11 +1,25 @@
 """Instantiate Configuration class and set default values."""
 
-from typing import Annotated, ClassVar
+import os
+import pickle  # noqa: S403
+import re
+import sys
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Annotated, Any, ClassVar
 
-from confz import BaseConfig, ConfigSources, FileSource
-from pydantic import AfterValidator, BaseModel, BeforeValidator
+from confz import BaseConfig, ConfigSources
+from confz.config_source import ConfigSource
+from confz.exceptions import FileException
+from confz.loaders import Loader, register_loader
+from loguru import logger
+from pydantic import AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field
 
-from halper.constants import CONFIG_PATH, CommentPlacement
+from halper.constants import CONFIG_CACHE_PATH, CONFIG_PATH, CommentPlacement
+
+# Bump when the layout of the cached configuration changes to invalidate existing caches
+CONFIG_CACHE_VERSION = 1
 
 
 def valid_comment_placement(value: str) -> CommentPlacement:
@@ -17,9 +31,143 @@ def valid_comment_placement(value: str) -> CommentPlacement:
     return CommentPlacement(value)
 
 
+def _intern_categories(config: dict[str, Any]) -> None:
+    """Intern category keys and category names in a parsed configuration.
+
+    Category names are repeated across the configuration and compared while indexing, so interning
+    them shares a single string object per name.
+
+    Args:
+        config (dict[str, Any]): The parsed configuration, updated in place.
+    """
+    categories = config.get("categories")
+    if not isinstance(categories, dict):
+        return
+
+    for category in categories.values():
+        if isinstance(category, dict) and isinstance(category.get("name"), str):
+            category["name"] = sys.intern(category["name"])
+
+    config["categories"] = {sys.intern(k): v for k, v in categories.items()}
+
+
+def _read_config_cache(cache_path: Path, stamp: tuple[int, int, int]) -> dict[str, Any] | None:
+    """Read a previously parsed configuration from the cache file.
+
+    Args:
+        cache_path (Path): Path to the pickled configuration cache.
+        stamp (tuple[int, int, int]): The cache version and the `(st_mtime_ns, st_size)` of the
+            source TOML file.
+
+    Returns:
+        dict[str, Any] | None: The cached configuration, or None if the cache is missing or stale.
+    """
+    try:
+        with cache_path.open("rb") as f:
+            if pickle.load(f) != stamp:  # noqa: S301
+                return None
+            return pickle.load(f)  # noqa: S301
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return None
+
+
+def _write_config_cache(
+    cache_path: Path, stamp: tuple[int, int, int], config: dict[str, Any]
+) -> None:
+    """Atomically write a parsed configuration to the cache file.
+
+    Failures are logged and ignored; the cache is an optimization, never a requirement.
+
+    Args:
+        cache_path (Path): Path to the pickled configuration cache.
+        stamp (tuple[int, int, int]): The cache version and the `(st_mtime_ns, st_size)` of the
+            source TOML file.
+        config (dict[str, Any]): The parsed configuration.
+    """
+    tmp_path = cache_path.with_suffix(".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as f:
+            pickle.dump(stamp, f)
+            pickle.dump(config, f)
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        logger.debug(f"Unable to write configuration cache '{cache_path}': {e}")
+
+
+def load_toml_cached(path: Path, cache_path: Path) -> dict[str, Any]:
+    """Load a TOML file, reusing a pickled copy when the file has not changed.
+
+    The cache is keyed by `CONFIG_CACHE_VERSION` and the file's modification time and size. Set
+    the `HALP_NO_CONFIG_CACHE` environment variable to always parse the TOML file.
+
+    Args:
+        path (Path): Path to the TOML file.
+        cache_path (Path): Path to the pickled configuration cache.
+
+    Returns:
+        dict[str, Any]: The parsed configuration.
+
+    Raises:
+        FileNotFoundError: If the TOML file does not exist.
+        FileException: If the TOML file can not be opened.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise
+    except OSError as e:
+        msg = f"Could not open config file '{path}'."
+        raise FileException(msg) from e
+
+    stamp = (CONFIG_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+    use_cache = not os.environ.get("HALP_NO_CONFIG_CACHE")
+
+    if use_cache and (config := _read_config_cache(cache_path, stamp)) is not None:
+        _intern_categories(config)
+        return config
+
+    # Only needed on a cache miss, so keep it off the startup path
+    import tomllib  # noqa: PLC0415
+
+    logger.trace("Parsing configuration from {}", path)
+    config = tomllib.loads(path.read_bytes().decode("utf-8"))
+
+    if use_cache:
+        _write_config_cache(cache_path, stamp, config)
+
+    _intern_categories(config)
+    return config
+
+
+@dataclass
+class CachedTomlSource(ConfigSource):
+    """Source config for a TOML file whose parsed contents are cached on disk."""
+
+    file: Path
+    cache_file: Path = CONFIG_CACHE_PATH
+
+
+class CachedTomlLoader(Loader):
+    """Config loader for `CachedTomlSource`."""
+
+    @classmethod
+    def populate_config(cls, config: dict, config_source: CachedTomlSource) -> None:
+        """Populate the config-dict with the contents of the cached TOML file."""
+        cls.update_dict_recursively(
+            config, load_toml_cached(config_source.file, config_source.cache_file)
+        )
+
+
+register_loader(CachedTomlSource, CachedTomlLoader)
+
+
 class CategoryConfig(BaseModel):
     """Category type."""
 
+    # Categories never change after loading, and unknown keys are almost always typos
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str = ""
     code_regex: str = ""
     comment_regex: str = ""
@@ -39,11 +187,30 @@ class HalpConfig(BaseConfig):  # type: ignore [misc]
     """Halper Configuration."""
 
     case_sensitive: bool = False
-    categories: dict[str, CategoryConfig] | None = None
+    categories: dict[str, CategoryConfig] = Field(default_factory=dict)
     command_name_ignore_regex: str = ""
     comment_placement: CP = CommentPlacement.BEST
     file_exclude_regex: str = ""
     file_globs: tuple[str, ...] = ()
     uncategorized_name: str = "uncategorized"
 
-    CONFIG_SOURCES: ClassVar[ConfigSources | None] = FileSource(file=CONFIG_PATH)
+    CONFIG_SOURCES: ClassVar[ConfigSources | None] = CachedTomlSource(file=CONFIG_PATH)
+
+    @cached_property
+    def regex_flags(self) -> int:
+        """Flags to use when matching the user-supplied regexes."""
+        return 0 if self.case_sensitive else re.IGNORECASE
+
+    @cached_property
+    def command_name_ignore_pattern(self) -> re.Pattern[str] | None:
+        """Compiled `command_name_ignore_regex`, or None if not set."""
+        if not self.command_name_ignore_regex:
+            return None
+        return re.compile(self.command_name_ignore_regex, flags=self.regex_flags)
+
+    @cached_property
+    def file_exclude_pattern(self) -> re.Pattern[str] | None:
+        """Compiled `file_exclude_regex`, or None if not set."""
+        if not self.file_exclude_regex:
+            return None
+        return re.compile(self.file_exclude_regex, flags=self.regex_flags)
@@ -1,6 +1,7 @@
 """Constants for Halp."""
 
 import os
+import sqlite3
 from enum import Enum
 from pathlib import Path
 
@@ -41,12 +42,56 @@ class SearchType(str, Enum):
     NAME = "name"
 
 
-CONFIG_DIR = Path(os.getenv("XDG_CONFIG_HOME", "~/.config")).expanduser().absolute() / "halp"
-DATA_DIR = Path(os.getenv("XDG_DATA_HOME", "~/.local/share")).expanduser().absolute() / "halp"
-DATA_DIR.mkdir(parents=True, exist_ok=True)
-STATE_DIR = Path(os.getenv("XDG_STATE_HOME", "~/.local/state")).expanduser().absolute() / "halp"
-CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", "~/.cache")).expanduser().absolute() / "halp"
+def _xdg_dir(env_var: str, default: str) -> Path:
+    """Resolve an XDG base directory for halp.
+
+    Absolute environment values are used as-is, so the home directory is only looked up when a
+    variable is unset or relative.
+
+    Args:
+        env_var (str): Name of the XDG environment variable.
+        default (str): Default location relative to the home directory.
+
+    Returns:
+        Path: The halp subdirectory of the resolved base directory.
+    """
+    value = os.environ.get(env_var)
+    if value and Path(value).is_absolute():
+        return Path(value) / "halp"
+
+    return Path(value or f"~/{default}").expanduser().absolute() / "halp"
+
+
+class HalpDatabase(SqliteDatabase):
+    """SQLite database which creates its directory when the first connection is opened."""
+
+    def _connect(self) -> sqlite3.Connection:
+        """Create the database's parent directory, then open the connection.
+
+        Returns:
+            sqlite3.Connection: The new connection.
+        """
+        Path(self.database).parent.mkdir(parents=True, exist_ok=True)
+        return super()._connect()
+
+
+CONFIG_DIR = _xdg_dir("XDG_CONFIG_HOME", ".config")
+DATA_DIR = _xdg_dir("XDG_DATA_HOME", ".local/share")
+STATE_DIR = _xdg_dir("XDG_STATE_HOME", ".local/state")
+CACHE_DIR = _xdg_dir("XDG_CACHE_HOME", ".cache")
 CONFIG_PATH = CONFIG_DIR / "config.toml"
+CONFIG_CACHE_PATH = CACHE_DIR / "config.pickle"
 DB_PATH = DATA_DIR / "halp.sqlite"
-DB = SqliteDatabase(DB_PATH)
+DB = HalpDatabase(
+    DB_PATH,
+    pragmas={
+        "journal_mode": "wal",  # Commits append to the WAL instead of rewriting the database
+        "synchronous": "normal",  # Safe with WAL and avoids an fsync per commit
+        "temp_store": "memory",
+        "cache_size": -64 * 1024,  # 64 MiB page cache
+        "mmap_size": 256 * 1024 * 1024,
+    },
+)
+# Keep `IN (...)` lists well under SQLite's host parameter limit
+ID_BATCH_SIZE = 500
 VERSION = "0.1.0"
@@ -1,4 +1,12 @@
-"""Models for the HALP app."""
+"""Models for the HALP app.
+
+The database models are imported eagerly. `Parser` and `Indexer` pull in the parsing grammar and
+progress display, which are only needed when indexing, so they are imported on first attribute
+access (PEP 562).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from .database import (
     Category,
@@ -7,14 +15,16 @@ from .database import (
     Database,
     File,
     HalpInfo,
-    TempCategory,
-    TempCommand,
-    TempCommandCategory,
-    TempFile,
 )
-from .parser import Parser
 
-from .indexer import Indexer  # isort:skip
+if TYPE_CHECKING:
+    from .indexer import Indexer  # noqa: TC004
+    from .parser import Parser  # noqa: TC004
+
+_LAZY_ATTRS = {
+    "Indexer": ".indexer",
+    "Parser": ".parser",
+}
 
 __all__ = [
     "Category",
@@ -25,8 +35,22 @@ __all__ = [
     "HalpInfo",
     "Indexer",
     "Parser",
-    "TempCategory",
-    "TempCommand",
-    "TempCommandCategory",
-    "TempFile",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the submodule providing `name` and cache the attribute on this package.
+
+    Returns:
+        Any: The requested attribute.
+
+    Raises:
+        AttributeError: If `name` is not provided by any submodule.
+    """
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1,18 +1,30 @@
 """Database models for the HALP app."""
 
 import os
-import re
+from typing import TYPE_CHECKING
 
 from loguru import logger
-from peewee import BooleanField, ForeignKeyField, Model, PeeweeException, SqliteDatabase, TextField
+from peewee import (
+    JOIN,
+    BooleanField,
+    ForeignKeyField,
+    Model,
+    ModelSelect,
+    PeeweeException,
+    SqliteDatabase,
+    TextField,
+    chunked,
+)
 from rich.syntax import Syntax
 from rich.table import Table
 from semver.version import Version
 
-from halper.config import HalpConfig
-from halper.constants import DB, DB_PATH, CommandType
+from halper.constants import DB, DB_PATH, ID_BATCH_SIZE, CommandType
 from halper.utils import errors
 
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
 
 class BaseModel(Model):
     """Base model for HALP models."""
@@ -22,6 +34,15 @@ class BaseModel(Model):
 
         database = DB
 
+    @classmethod
+    def atomic(cls) -> "AbstractContextManager":
+        """Open a transaction on the database this model is bound to.
+
+        Returns:
+            AbstractContextManager: The transaction context manager.
+        """
+        return cls._meta.database.atomic()
+
 
 class HalpInfo(BaseModel):
     """HALP info model."""
@@ -36,13 +57,6 @@ class File(BaseModel):
     path = TextField()
 
 
-class TempFile(BaseModel):
-    """Temporary files model."""
-
-    name = TextField()
-    path = TextField()
-
-
 class Category(BaseModel):
     """Categories model."""
 
@@ -54,17 +68,6 @@ class Category(BaseModel):
     path_regex = TextField(null=True)
 
 
-class TempCategory(BaseModel):
-    """Temporary categories model."""
-
-    name = TextField(unique=True)
-    description = TextField(null=True)
-    code_regex = TextField(null=True)
-    comment_regex = TextField(null=True)
-    command_name_regex = TextField(null=True)
-    path_regex = TextField(null=True)
-
-
 class Command(BaseModel):
     """Commands model."""
 
@@ -76,6 +79,12 @@ class Command(BaseModel):
     hidden = BooleanField(default=False)
     has_custom_description = BooleanField(default=False)
 
+    class Meta:
+        """Meta class for command model."""
+
+        # Command lists filter on the hidden flag and sort by name
+        indexes = ((("hidden", "name"), False),)
+
     def __str__(self) -> str:
         """Return string representation of command."""
         return (
@@ -109,6 +118,65 @@ class Command(BaseModel):
         # Construct the list of category names
         return [category.name for category in category_query]
 
+    @staticmethod
+    def select_with_file() -> ModelSelect:
+        """Select commands together with their file.
+
+        Joining the file up front means reading `command.file` does not issue a query per command.
+
+        Returns:
+            ModelSelect: A query selecting commands and their files.
+        """
+        return Command.select(Command, File).join(File, JOIN.LEFT_OUTER).switch(Command)
+
+    @staticmethod
+    def category_names_by_command(command_ids: list[int]) -> dict[int, list[str]]:
+        """Return the category names of many commands using one query per `ID_BATCH_SIZE` IDs.
+
+        Args:
+            command_ids (list[int]): IDs of the commands to look up.
+
+        Returns:
+            dict[int, list[str]]: Alphabetically ordered category names keyed by command ID.
+        """
+        names: dict[int, list[str]] = {command_id: [] for command_id in command_ids}
+        for batch in chunked(command_ids, ID_BATCH_SIZE):
+            query = (
+                CommandCategory.select(CommandCategory.command, Category.name)
+                .join(Category)
+                .where(CommandCategory.command.in_(batch))
+                .order_by(Category.name)
+                .tuples()
+            )
+            for command_id, category_name in query:
+                names[command_id].append(category_name)
+
+        return names
+
+    @staticmethod
+    def by_category(category_ids: list[int], hidden: bool = False) -> dict[int, list["Command"]]:
+        """Return the commands of many categories using a single query.
+
+        Args:
+            category_ids (list[int]): IDs of the categories to look up.
+            hidden (bool, optional): Whether to return hidden or visible commands. Defaults to False.
+
+        Returns:
+            dict[int, list[Command]]: Commands ordered by name, keyed by category ID.
+        """
+        commands: dict[int, list[Command]] = {category_id: [] for category_id in category_ids}
+        query = (
+            Command.select_with_file()
+            .select_extend(CommandCategory.category)
+            .join(CommandCategory)
+            .where(CommandCategory.category.in_(category_ids), Command.hidden == hidden)
+            .order_by(Command.name)
+        )
+        for command in query:
+            commands[command.commandcategory.category_id].append(command)
+
+        return commands
+
     def table(
         self, full_output: bool = False, found_in_tldr: bool = False, show_id: bool = False
     ) -> Table:
@@ -157,18 +225,6 @@ class Command(BaseModel):
                 return Syntax(self.code, "shell")
 
 
-class TempCommand(BaseModel):
-    """Temporary commands model."""
-
-    code = TextField()
-    command_type = TextField()
-    description = TextField(null=True)
-    file = ForeignKeyField(TempFile, backref="commands", null=True)
-    name = TextField(index=True)
-    hidden = BooleanField(default=False)
-    has_custom_description = BooleanField(default=False)
-
-
 class CommandCategory(BaseModel):
     """Command categories model."""
 
@@ -176,34 +232,17 @@ class CommandCategory(BaseModel):
     category = ForeignKeyField(Category, backref="commands")
     is_custom = BooleanField(default=False)
 
+    class Meta:
+        """Meta class for command category model."""
+
+        # Cover category -> command lookups without reading the table rows
+        indexes = ((("category", "command"), False),)
+
     def __str__(self) -> str:
         """Return string representation of command category."""
         return f"{self.command=}, {self.category=}, {self.is_custom=}"
 
 
-class TempCommandCategory(BaseModel):
-    """Temporary command categories model."""
-
-    command = ForeignKeyField(TempCommand, backref="categories")
-    category = ForeignKeyField(TempCategory, backref="commands")
-    is_custom = BooleanField(default=False)
-
-
-# Custom regexp function for SQLite. Registered in Database.instantiate()
-def regexp(pattern: str, value: str) -> bool:
-    """Evaluate a regular expression pattern against a given string value.
-
-    Args:
-        pattern (str): The regular expression pattern to search for.
-        value (str): The string value to be searched.
-
-    Returns:
-        bool: True if the pattern is found in the value, False otherwise.
-    """
-    case_sensitive_regex = 0 if HalpConfig().case_sensitive else re.IGNORECASE
-    return re.search(pattern, value, flags=case_sensitive_regex) is not None
-
-
 class Database:
     """Database controller for the HALP app."""
 
@@ -218,11 +257,18 @@ class Database:
             current_version (str): Current version of the app.
 
         Raises:
-            errors.AppDirectoryError: If the directory does not exist or is not writable.
+            errors.AppDirectoryError: If the directory can not be created or is not writable.
             PeeweeException: If a Peewee-specific error occurs during instantiation.
         """
         logger.debug(f"Instantiating database. {DB_PATH=}")
 
+        # Create the data directory on first use rather than on every import
+        try:
+            DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            msg = f"Unable to create {DB_PATH.parent}"
+            raise errors.AppDirectoryError(msg, e) from e
+
         # Check file permissions
         if not os.access(DB_PATH.parent, os.W_OK):
             msg = f"Write permission is not available on {DB_PATH.parent}"
@@ -239,9 +285,6 @@ class Database:
             ]
         )
 
-        # Register the regexp function with the SQLite database
-        DB.register_function(regexp, "REGEXP")
-
         # Migrate the db if necessary
         self.migrate_db(current_version)
 
@@ -1,11 +1,13 @@
 """Command to (re)create the index of commands."""
 
 import glob
-import re
+from itertools import starmap
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
 import typer
 from loguru import logger
+from peewee import JOIN, chunked
 from rich.progress import track
 from rich.table import Table
 
@@ -18,13 +20,34 @@ from halper.models import (
     Database,
     File,
     Parser,
-    TempCategory,
-    TempCommand,
-    TempCommandCategory,
-    TempFile,
 )
+from halper.models.parser import compile_categories
 from halper.utils import console, errors
 
+if TYPE_CHECKING:
+    import re
+
+# Columns identifying a command across re-indexing, in SavedCommand field order
+COMMAND_KEY_COLUMNS = (
+    Command.name,
+    Command.code,
+    File.path,
+    Command.description,
+    Command.hidden,
+    Command.has_custom_description,
+)
+
+
+class SavedCommand(NamedTuple):
+    """User-configured settings of a command, captured before the index is cleared."""
+
+    name: str
+    code: str
+    file_path: str | None
+    description: str | None
+    hidden: bool
+    has_custom_description: bool
+
 
 class Indexer:
     """Indexer class for creating and rebuilding the index of commands from configuration and file data.
@@ -37,8 +60,7 @@ class Indexer:
 
     def __init__(self, rebuild: bool = False) -> None:
         self.globs: tuple[str, ...] = HalpConfig().file_globs
-        self.exclude_regex: str = HalpConfig().file_exclude_regex
-        self.case_sensitive: bool = HalpConfig().case_sensitive
+        self.exclude_pattern: re.Pattern[str] | None = HalpConfig().file_exclude_pattern
         self.database = Database(DB)
 
         # Set rebuild flag
@@ -59,15 +81,15 @@ class Indexer:
         Raises:
             errors.NoFilesFoundError: If no files are found matching the globs.
         """
-        case_sensitive_regex = 0 if self.case_sensitive else re.IGNORECASE
         files = []
         return_strings = []
+        home = str(Path.home())
 
         for user_glob in self.globs:
             # Expand '~' to home directory
-            glob_path = re.sub(r"^~", str(Path.home()), user_glob)
+            glob_path = home + user_glob[1:] if user_glob.startswith("~") else user_glob
 
-            logger.debug(f"Searching for files matching: {glob_path}")
+            logger.debug("Searching for files matching: {}", glob_path)
 
             found_files = glob.glob(glob_path, recursive=True)  # noqa: PTH207
             if not found_files:
@@ -75,111 +97,152 @@ class Indexer:
                 continue
             files.extend([Path(x) for x in found_files])
 
+        # Check the in-memory exclude pattern before stat()ing each candidate
         files = [
             file
             for file in files
-            if file.is_file()
-            and (
-                not self.exclude_regex
-                or not re.search(self.exclude_regex, str(file), flags=case_sensitive_regex)
-            )
+            if (self.exclude_pattern is None or not self.exclude_pattern.search(str(file)))
+            and file.is_file()
         ]
 
         if not files:
             raise errors.NoFilesFoundError
 
-        for file in files:
-            File.get_or_create(name=file.name, path=file)
-        return_strings.insert(0, ("✅", f"{File.select().count()}", "Files parsed"))
+        # Globs may overlap, so drop duplicate paths before inserting all files at once
+        files = list({str(file): file for file in files}.values())
+        with File.atomic():
+            for batch in chunked(files, 100):
+                File.insert_many(
+                    [{"name": file.name, "path": str(file)} for file in batch]
+                ).execute()
+
+        return_strings.insert(0, ("✅", f"{len(files)}", "Files parsed"))
         return return_strings
 
     @staticmethod
-    def _persist_command_settings() -> None:
-        """Update the database with user configurable data from the temporary command settings."""
-        # Find commands with values to persist
-        commands_to_persist = TempCommand.select().where(
-            (TempCommand.hidden == True) | (TempCommand.has_custom_description == True)  # noqa: E712
+    def _save_command_settings() -> tuple[list[SavedCommand], list[tuple[SavedCommand, str]]]:
+        """Capture hidden statuses, custom descriptions, and custom categories before re-indexing.
+
+        Returns:
+            tuple[list[SavedCommand], list[tuple[SavedCommand, str]]]: The hidden or custom described
+                commands, and the commands with a custom category paired with that category's name.
+        """
+        saved_commands = list(
+            starmap(
+                SavedCommand,
+                Command.select(*COMMAND_KEY_COLUMNS)
+                .join(File, JOIN.LEFT_OUTER)
+                .where((Command.hidden == True) | (Command.has_custom_description == True))  # noqa: E712
+                .tuples(),
+            )
         )
+        saved_categories = [
+            (SavedCommand(*row), category_name)
+            for *row, category_name in CommandCategory.select(*COMMAND_KEY_COLUMNS, Category.name)
+            .join(Command)
+            .join(File, JOIN.LEFT_OUTER)
+            .switch(CommandCategory)
+            .join(Category)
+            .where(CommandCategory.is_custom == True)  # noqa: E712
+            .tuples()
+        ]
 
-        for c in commands_to_persist:
-            # Update commands
-            if c.hidden and not c.has_custom_description:
-                update_type = "hidden status"
-                num_rows = (
-                    Command.update(hidden=c.hidden)
-                    .where(
-                        (Command.name == c.name)
-                        & (Command.code == c.code)
-                        & (Command.file == c.file)
-                        & (Command.description == c.description)
-                    )
-                    .execute()
-                )
+        return saved_commands, saved_categories
 
-            elif c.hidden and c.has_custom_description:
-                update_type = "hidden status and custom description"
-                num_rows = (
-                    Command.update(
-                        hidden=c.hidden,
-                        description=c.description,
-                        has_custom_description=c.has_custom_description,
-                    )
-                    .where(
-                        (Command.name == c.name)
-                        & (Command.code == c.code)
-                        & (Command.file == c.file)
-                    )
-                    .execute()
-                )
+    @staticmethod
+    def _persist_command_values(saved_commands: list[SavedCommand]) -> None:
+        """Restore hidden statuses and custom descriptions saved before re-indexing.
 
-            elif not c.hidden and c.has_custom_description:
-                update_type = "custom description"
-                num_rows = (
-                    Command.update(
-                        description=c.description,
-                        has_custom_description=c.has_custom_description,
-                    )
-                    .where(
-                        (Command.name == c.name)
-                        & (Command.code == c.code)
-                        & (Command.file == c.file)
-                    )
-                    .execute()
-                )
+        Args:
+            saved_commands (list[SavedCommand]): The commands captured by `_save_command_settings`.
+        """
+        if not saved_commands:
+            return
+
+        # Index the new commands once rather than querying for each saved command
+        command_index: dict[tuple[str, str, str | None], list[tuple[int, str | None]]] = {}
+        for command_id, name, code, file_path, description in (
+            Command.select(Command.id, Command.name, Command.code, File.path, Command.description)
+            .join(File, JOIN.LEFT_OUTER)
+            .tuples()
+        ):
+            command_index.setdefault((name, code, file_path), []).append((command_id, description))
+
+        hidden_ids: list[int] = []
+        ids_by_description: dict[str | None, list[int]] = {}
+        for c in saved_commands:
+            matches = command_index.get((c.name, c.code, c.file_path), [])
 
-            if num_rows > 1:
-                logger.warning(f"Persist {update_type} for: {c.name}. {num_rows} commands matched.")
+            if c.hidden and not c.has_custom_description:
+                update_type = "hidden status"
+                ids = [i for i, description in matches if description == c.description]
+                hidden_ids.extend(ids)
             else:
-                logger.debug(f"Persist {update_type} for: {c.name}")
+                update_type = (
+                    "hidden status and custom description" if c.hidden else "custom description"
+                )
+                ids = [i for i, _ in matches]
+                if c.hidden:
+                    hidden_ids.extend(ids)
+                ids_by_description.setdefault(c.description, []).extend(ids)
 
-        # Persist custom categories for existing commands
-        command_cats_to_persist = TempCommandCategory.select().where(
-            TempCommandCategory.is_custom == True  # noqa: E712
-        )
+            if len(ids) > 1:
+                logger.warning(f"Persist {update_type} for: {c.name}. {len(ids)} commands matched.")
+            else:
+                logger.debug("Persist {} for: {}", update_type, c.name)
+
+        # Apply the settings with one UPDATE per batch of IDs and per custom description
+        with Command.atomic():
+            for batch in chunked(hidden_ids, 500):
+                Command.update(hidden=True).where(Command.id.in_(batch)).execute()
+            for description, ids in ids_by_description.items():
+                for batch in chunked(ids, 500):
+                    Command.update(description=description, has_custom_description=True).where(
+                        Command.id.in_(batch)
+                    ).execute()
 
-        for c in command_cats_to_persist:
-            command = Command.get_or_none(
-                (Command.name == c.command.name)
-                & (Command.code == c.command.code)
-                & (Command.file == c.command.file)
-                & (Command.description == c.command.description)
-                & (Command.hidden == c.command.hidden)
-                & (Command.has_custom_description == c.command.has_custom_description)
-            )
-            category = Category.get_or_none(name=c.category.name)
+    @staticmethod
+    def _persist_command_categories(saved_categories: list[tuple[SavedCommand, str]]) -> None:
+        """Restore custom categories saved before re-indexing.
 
-            if not command or not category:
+        Args:
+            saved_categories (list[tuple[SavedCommand, str]]): The commands with a custom category
+                captured by `_save_command_settings`, paired with that category's name.
+        """
+        if not saved_categories:
+            return
+
+        # Resolve commands and categories from memory rather than two queries per custom category
+        command_ids: dict[tuple, int] = {}
+        for command_id, *key in (
+            Command.select(Command.id, *COMMAND_KEY_COLUMNS).join(File, JOIN.LEFT_OUTER).tuples()
+        ):
+            command_ids.setdefault(tuple(key), command_id)
+        category_ids = dict(Category.select(Category.name, Category.id).tuples())
+
+        # A command keeps only its last custom category, as when they were applied one at a time
+        new_categories: dict[int, int] = {}
+        for saved_command, category_name in saved_categories:
+            command_id = command_ids.get(saved_command)
+            category_id = category_ids.get(category_name)
+            if command_id is None or category_id is None:
                 continue
 
-            # Delete auto-assigned categories
-            CommandCategory.delete().where(
-                (CommandCategory.command == command) & (CommandCategory.category != category)
-            ).execute()
-
-            # Add custom category
-            CommandCategory.create(command=command, category=category, is_custom=True)
-
-            logger.debug(f"Persist custom category for: {c.command.name}")
+            new_categories[command_id] = category_id
+            logger.debug("Persist custom category for: {}", saved_command.name)
+
+        # Replace the auto-assigned categories of each command with its custom category
+        with Command.atomic():
+            for batch in chunked(new_categories.items(), 250):
+                CommandCategory.delete().where(
+                    CommandCategory.command.in_([command_id for command_id, _ in batch])
+                ).execute()
+                CommandCategory.insert_many(
+                    [
+                        {"command": command_id, "category": category_id, "is_custom": True}
+                        for command_id, category_id in batch
+                    ]
+                ).execute()
 
     @staticmethod
     def _command_output() -> list[tuple[str, str, str]]:
@@ -207,10 +270,10 @@ class Indexer:
         Returns:
             tuple[str, str, str]: Status indicator, count of categories added, and a descriptive message.
         """
-        if HalpConfig().categories is None:
+        if not (categories := HalpConfig().categories):
             return ("❓", "", "No categories from config")
 
-        config_categories = [d.model_dump() for d in HalpConfig().categories.values()]
+        config_categories = [d.model_dump() for d in categories.values()]
 
         # Add categories to the database
         num_categories = Category.insert_many(config_categories).execute()
@@ -225,108 +288,58 @@ class Indexer:
     def _add_commands(command_list: list[dict]) -> int:
         """Insert a list of command details into the database.
 
+        Commands are inserted in batches within a single transaction. The IDs of each batch are
+        read back with `RETURNING` and used to insert all of the batch's command categories at once.
+
         Args:
             command_list (list[dict]): List of command details to be added.
 
         Returns:
             int: The number of commands successfully added to the database.
         """
-        for command in command_list:
-            row = Command.insert(
-                name=command["name"],
-                code=command["code"],
-                file=command["file"],
-                command_type=command["command_type"].name,
-                description=command["description"],
-            ).execute()
-
-            CommandCategory.insert_many(
-                [{"command": row, "category": category} for category in command["categories"]]
-            ).execute()
+        with Command.atomic():
+            for batch in chunked(command_list, 100):
+                rows = (
+                    Command.insert_many(
+                        [
+                            {
+                                "name": command["name"],
+                                "code": command["code"],
+                                "file": command["file"],
+                                "command_type": command["command_type"].name,
+                                "description": command["description"],
+                            }
+                            for command in batch
+                        ]
+                    )
+                    .returning(Command.id)
+                    .tuples()
+                    .execute()
+                )
 
-        return len(command_list)
+                # Rowids are assigned in VALUES order, whatever order RETURNING yields them in
+                command_ids = sorted(command_id for (command_id,) in rows)
 
-    def _create_temporary_tables(self) -> None:
-        """Create temporary tables for storing file and category data during the indexing process."""
-        if TempFile.table_exists():
-            self._drop_temporary_tables()
-
-        # Create temporary tables
-        TempFile.create_table(safe=True)
-        TempCategory.create_table(safe=True)
-        TempCommand.create_table(safe=True)
-        TempCommandCategory.create_table(safe=True)
-
-        # Copy data to TempFile
-        tmp_files_to_insert = [TempFile(name=file.name, path=file.path) for file in File.select()]
-        with DB.atomic():
-            TempFile.bulk_create(tmp_files_to_insert, batch_size=100)
-
-        # Copy data to TempCategory
-        tmp_categories_to_insert = [
-            TempCategory(
-                name=category.name,
-                description=category.description,
-                code_regex=category.code_regex,
-                comment_regex=category.comment_regex,
-                command_name_regex=category.command_name_regex,
-                path_regex=category.path_regex,
-            )
-            for category in Category.select()
-        ]
-        with DB.atomic():
-            TempCategory.bulk_create(tmp_categories_to_insert, batch_size=100)
-
-        # Copy data to TempCommand
-        tmp_commands_to_insert = [
-            TempCommand(
-                code=command.code,
-                command_type=command.command_type,
-                description=command.description,
-                file=TempFile.get_or_none(TempFile.path == command.file.path) or None,
-                name=command.name,
-                hidden=command.hidden,
-                has_custom_description=command.has_custom_description,
-            )
-            for command in Command.select()
-        ]
-        with DB.atomic():
-            TempCommand.bulk_create(tmp_commands_to_insert, batch_size=100)
-
-        # Copy data to TempCommandCategory
-        tmp_command_cats_to_insert = [
-            TempCommandCategory(
-                command=TempCommand.get(
-                    TempCommand.name == command_cat.command.name,
-                    TempCommand.code == command_cat.command.code,
-                ),
-                category=TempCategory.get(TempCategory.name == command_cat.category.name),
-                is_custom=command_cat.is_custom,
-            )
-            for command_cat in CommandCategory.select()
-        ]
-        with DB.atomic():
-            TempCommandCategory.bulk_create(tmp_command_cats_to_insert, batch_size=100)
+                command_categories = [
+                    {"command": command_id, "category": category}
+                    for command_id, command in zip(command_ids, batch, strict=True)
+                    for category in command["categories"]
+                ]
+                if command_categories:
+                    CommandCategory.insert_many(command_categories).execute()
 
-    @staticmethod
-    def _drop_temporary_tables() -> None:
-        """Remove temporary tables used during the indexing process."""
-        TempCommandCategory.drop_table()
-        TempCommand.drop_table()
-        TempCategory.drop_table()
-        TempFile.drop_table()
+        return len(command_list)
 
     def do_index(self) -> None:
         """Index commands from configured files into the database.
 
         Execute a full indexing workflow to discover and store commands from source files. The workflow:
-        1. Creates temporary tables to preserve existing command settings during rebuild
+        1. Saves existing command settings in memory unless rebuilding
         2. Clears existing database entries
         3. Loads configured categories
         4. Scans and indexes files matching configured globs
         5. Parses each file to extract commands
-        6. Persists command settings from temporary tables if not rebuilding
-        7. Cleans up temporary tables
+        6. Restores the saved command settings
 
         This function enables maintaining an up-to-date searchable index of commands as source files change.
         Run this after modifying command files or changing the configuration.
@@ -344,9 +357,10 @@ class Indexer:
         grid.add_column()
         grid_rows = []
 
-        # Create temporary tables and clear production database entries
-        if not self.rebuild:
-            self._create_temporary_tables()
+        # Save user-configured settings before clearing production database entries
+        saved_commands, saved_categories = (
+            self._save_command_settings() if not self.rebuild else ([], [])
+        )
 
         # Clear production database entries
         self.database.clear_data([File, Category, Command, CommandCategory])
@@ -363,9 +377,10 @@ class Indexer:
             logger.error("No files found matching the globs in your configuration.")
             raise typer.Exit(code=1) from e
 
-        # Add commands to the database
+        # Add commands to the database, compiling the category patterns once for all files
+        categories = compile_categories(Category.select(), HalpConfig().regex_flags)
         for file in track(File.select(), description="Processing files...", transient=True):
-            p = Parser(file.path)
+            p = Parser(file.path, categories=categories)
 
             found_commands = p.parse()
 
@@ -373,18 +388,14 @@ class Indexer:
                 grid_rows.append(("🤷", "", f"[dim]No commands found in '{file.path}'"))
                 continue
             self._add_commands(found_commands)
-            logger.debug(f"Add {len(found_commands)} commands from '{file.path}'")
+            logger.debug("Add {} commands from '{}'", len(found_commands), file.path)
 
-        if not self.rebuild:
-            self._persist_command_settings()
+        self._persist_command_values(saved_commands)
+        self._persist_command_categories(saved_categories)
 
         # Build details on command updates
         grid_rows.extend(list(self._command_output()))
 
-        # Cleanup
-        if not self.rebuild:
-            self._drop_temporary_tables()
-
         # Print table
         for row in grid_rows:
             grid.add_row(*row)
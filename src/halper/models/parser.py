@@ -1,7 +1,9 @@
 """Parses files for commands and adds them to the database."""
 
 import re
+from collections.abc import Iterable
 from pathlib import Path
+from typing import NamedTuple
 
 from loguru import logger
 from parsy import ParseError
@@ -11,6 +13,42 @@ from halper.models import Category, File
 from halper.utils.text_parsers import parse_file
 
 
+class CategoryMatcher(NamedTuple):
+    """A category with its regex patterns compiled for matching commands."""
+
+    category: Category
+    code: re.Pattern[str] | None
+    comment: re.Pattern[str] | None
+    command_name: re.Pattern[str] | None
+    path: re.Pattern[str] | None
+
+
+def compile_categories(categories: Iterable[Category], flags: int) -> tuple[CategoryMatcher, ...]:
+    """Compile the regex patterns of each category once so they can be reused for every command.
+
+    Args:
+        categories (Iterable[Category]): The categories to compile.
+        flags (int): The regex flags to compile the patterns with.
+
+    Returns:
+        tuple[CategoryMatcher, ...]: The categories with their compiled patterns. Empty patterns are None.
+    """
+
+    def _compile(pattern: str | None) -> re.Pattern[str] | None:
+        return re.compile(pattern, flags=flags) if pattern else None
+
+    return tuple(
+        CategoryMatcher(
+            category=cat,
+            code=_compile(cat.code_regex),
+            comment=_compile(cat.comment_regex),
+            command_name=_compile(cat.command_name_regex),
+            path=_compile(cat.path_regex),
+        )
+        for cat in categories
+    )
+
+
 class Parser:
     """Extract shell script components from files and categorize them for database storage.
 
@@ -19,7 +57,9 @@ class Parser:
     the configuration before updating the database with this information.
     """
 
-    def __init__(self, path: Path | str) -> None:
+    def __init__(
+        self, path: Path | str, categories: tuple[CategoryMatcher, ...] | None = None
+    ) -> None:
         """Initialize the parser with a file path.
 
         Resolve the provided file path and set up the parser to process the file. Initialize
@@ -27,12 +67,23 @@ class Parser:
 
         Args:
             path (Path | str): The path of the file to parse.
+            categories (tuple[CategoryMatcher, ...] | None, optional): Categories compiled with
+                `compile_categories`, shared when parsing many files. Defaults to compiling the
+                categories in the database.
         """
-        if isinstance(path, str):
-            path = Path(path)
+        self.path = Path(path).expanduser().resolve()
+        self.regex_flags = HalpConfig().regex_flags
+        self.categories = (
+            categories
+            if categories is not None
+            else compile_categories(Category.select(), self.regex_flags)
+        )
 
-        self.path = path.expanduser().resolve()
-        self.regex_flags = 0 if HalpConfig().case_sensitive else re.IGNORECASE
+        # The path is the same for every command in the file, so match path patterns once
+        path = str(self.path)
+        self.path_matches: tuple[bool, ...] = tuple(
+            bool(matcher.path and matcher.path.search(path)) for matcher in self.categories
+        )
         self.file = self._fetch_file_record()
 
     def _fetch_file_record(self) -> File:
@@ -50,17 +101,17 @@ class Parser:
         )
 
         if created:
-            logger.debug(f"Added file '{file.name}' to database")
+            logger.debug("Added file '{}' to database", file.name)
         else:
-            logger.trace(f"File '{file.name}' already exists in database")
+            logger.trace("File '{}' already exists in database", file.name)
 
         return file
 
     def _categorize_command(self, result: dict[str, str]) -> list[Category]:
         """Categorize a command based on regex patterns defined in categories.
 
-        Use the provided command details to match against category regex patterns. If a command
-        matches a category pattern, categorize the command accordingly.
+        Use the provided command details to match against the compiled category regex patterns. If a
+        command matches a category pattern, categorize the command accordingly.
 
         Args:
             result (dict[str, str]): The parsed command details.
@@ -69,17 +120,19 @@ class Parser:
             list[Category]: A list of categories that the command belongs to.
         """
         matched_categories: list[Category] = []
-        categories = Category.select()
-
-        for cat in categories:
-            for pattern, text in [
-                (cat.code_regex, result["code"]),
-                (cat.comment_regex, result["description"]),
-                (cat.command_name_regex, result["name"]),
-                (cat.path_regex, str(self.path)),
-            ]:
-                if pattern and text and re.search(pattern, text, flags=self.regex_flags):
-                    matched_categories.append(cat)
+
+        for matcher, path_match in zip(self.categories, self.path_matches, strict=True):
+            if path_match:
+                matched_categories.append(matcher.category)
+                continue
+
+            for pattern, text in (
+                (matcher.code, result["code"]),
+                (matcher.comment, result["description"]),
+                (matcher.command_name, result["name"]),
+            ):
+                if pattern and text and pattern.search(text):
+                    matched_categories.append(matcher.category)
                     break
 
         if matched_categories:
@@ -100,7 +153,7 @@ class Parser:
             list: A list of dictionaries, each representing a parsed command with its details.
         """
         # Ignore commands that match the ignore regex
-        command_name_ignore_regex = HalpConfig().command_name_ignore_regex
+        command_name_ignore_pattern = HalpConfig().command_name_ignore_pattern
 
         categorized_commands: list[dict] = []
 
@@ -108,15 +161,13 @@ class Parser:
         try:
             results = parse_file.many().parse(self.path.read_text())
         except ParseError as e:
-            logger.trace(f"No commands found in file {self.path}: {e}")
+            logger.trace("No commands found in file {}: {}", self.path, e)
             return categorized_commands
 
         for result in results:
             # Pass over commands that match the ignore regex
-            if command_name_ignore_regex and re.search(
-                command_name_ignore_regex, result["name"], flags=self.regex_flags
-            ):
-                logger.trace(f"Ignored command '{result['name']}' in {self.path}")
+            if command_name_ignore_pattern and command_name_ignore_pattern.search(result["name"]):
+                logger.trace("Ignored command '{}' in {}", result["name"], self.path)
                 continue
 
             # Find categories for command
@@ -1,16 +1,37 @@
-"""Shared utilities for Halp."""
+"""Shared utilities for Halp.
+
+Submodules are imported on first attribute access (PEP 562) so that a single CLI invocation only
+pays for the utilities it uses. `console` is the exception: it shares its name with the
+`halper.utils.console` submodule, and importing that submodule would rebind the package attribute
+to the module, so it is imported eagerly.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from .console import console  # isort:skip
-from .logging import InterceptHandler, instantiate_logger  # isort:skip
 
-from .helpers import (
-    check_python_version,
-    edit_config,
-    get_tldr_command,
-    strip_last_two_lines,
-    validate_config,
-)
-from .mankier import get_mankier_table
+if TYPE_CHECKING:
+    from .helpers import (  # noqa: TC004
+        check_python_version,
+        edit_config,
+        get_tldr_command,
+        strip_last_two_lines,
+        validate_config,
+    )
+    from .logging import InterceptHandler, instantiate_logger  # noqa: TC004
+    from .mankier import get_mankier_table  # noqa: TC004
+
+_LAZY_ATTRS = {
+    "InterceptHandler": ".logging",
+    "check_python_version": ".helpers",
+    "edit_config": ".helpers",
+    "get_mankier_table": ".mankier",
+    "get_tldr_command": ".helpers",
+    "instantiate_logger": ".logging",
+    "strip_last_two_lines": ".helpers",
+    "validate_config": ".helpers",
+}
 
 __all__ = [
     "InterceptHandler",
@@ -23,3 +44,21 @@ __all__ = [
     "strip_last_two_lines",
     "validate_config",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the submodule providing `name` and cache the attribute on this package.
+
+    Returns:
+        Any: The requested attribute.
+
+    Raises:
+        AttributeError: If `name` is not provided by any submodule.
+    """
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1,10 +1,11 @@
 """Helper functions for the halp package."""
 
-import shutil
+import subprocess  # noqa: S404
 import sys
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import sh
 import typer
 from confz import validate_all_configs
 from loguru import logger
@@ -15,6 +16,14 @@ from halper.constants import CONFIG_PATH
 
 from .console import console
 
+if TYPE_CHECKING:
+    import sh
+
+PATH_CONFIG_DEFAULT = Path(__file__).parent.parent / "default_config.toml"
+
+# The interpreter version can not change while running, so check it once at import
+_PY_OK = sys.version_info >= (3, 10)
+
 
 def strip_last_two_lines(multiline_string: str) -> str:
     r"""Remove the last line from a multiline string.
@@ -39,13 +48,19 @@ def strip_last_two_lines(multiline_string: str) -> str:
     return "\n".join(lines[:-2])
 
 
-def get_tldr_command() -> sh.Command | None:
+@cache
+def get_tldr_command() -> "sh.Command | None":
     """Get the 'tldr' command if available.
 
+    The PATH lookup is performed once per process and the result is cached. `sh` is imported here
+    rather than at module level since only man page lookups need it.
+
     Returns:
         An instance of sh.Command configured for 'tldr' if available,
         otherwise None.
     """
+    import sh  # noqa: PLC0415
+
     try:
         tldr_path = sh.which("tldr").strip()
         return sh.Command(tldr_path).bake("-q")
@@ -53,27 +68,80 @@ def get_tldr_command() -> sh.Command | None:
         return None
 
 
+@cache
+def _default_config_bytes() -> bytes:
+    """Read the packaged default configuration file once per process.
+
+    Returns:
+        bytes: The contents of the default configuration file.
+    """
+    return PATH_CONFIG_DEFAULT.read_bytes()
+
+
 def check_python_version() -> bool:
     """Check the Python version.
 
     Returns:
-        bool: True if the Python version is >= 3.9, False otherwise.
+        bool: True if the Python version is >= 3.10, False otherwise.
     """
-    return sys.version_info >= (3, 10)
+    return _PY_OK
+
 
+def create_default_config() -> bool:
+    """Create a default configuration file unless one already exists.
 
-def create_default_config() -> None:
-    """Create a default configuration file."""
-    CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    default_config_file = Path(__file__).parent.parent / "default_config.toml"
-    shutil.copy(default_config_file, CONFIG_PATH)
+    The file is opened in exclusive-create mode so that an existing configuration is detected by the
+    same syscall that would create it.
+
+    Returns:
+        bool: True if a default configuration file was created, False if one already existed.
+    """
+    try:
+        config_file = CONFIG_PATH.open("xb")
+    except FileNotFoundError:
+        CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        config_file = CONFIG_PATH.open("xb")
+    except FileExistsError:
+        return False
+
+    with config_file:
+        config_file.write(_default_config_bytes())
 
     msg = """\
 [bold]halp requires a configuration file to run[/bold]
 Empty configuration created, edit before continuing
 """
     console.print(msg)
-    edit_config(exit_code=1)
+    return True
+
+
+def _locate_file(path: Path) -> None:
+    """Reveal a file in the system file manager without waiting for it to open.
+
+    Spawn the platform launcher in a new session and return immediately. Fall back to
+    `typer.launch` if the launcher can not be started.
+
+    Args:
+        path (Path): The file to reveal.
+    """
+    if sys.platform == "darwin":
+        args = ["open", "-R", str(path)]
+    elif sys.platform == "win32":
+        args = ["explorer", f"/select,{path}"]
+    else:
+        args = ["xdg-open", str(path.parent)]
+
+    try:
+        subprocess.Popen(  # noqa: S603
+            args,
+            start_new_session=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+        )
+    except OSError:
+        typer.launch(str(path), locate=True)
 
 
 def edit_config(exit_code: int = 0) -> None:
@@ -85,22 +153,23 @@ def edit_config(exit_code: int = 0) -> None:
 
     Args:
         exit_code (int): Exit code to use when terminating the program after launching editor.
-            Defaults to 0.
+            Defaults to 0. Always 1 when a default configuration file was created.
 
     Raises:
         typer.Exit: Always exits after launching editor with the specified exit_code.
     """
-    if not CONFIG_PATH.exists():
-        create_default_config()
+    if create_default_config():
+        exit_code = 1
 
     msg = f"""\
 Config location: '{CONFIG_PATH}'
 [dim]Attempting to open file...[/dim]"""
     console.print(msg)
-    typer.launch(str(CONFIG_PATH), locate=True)
+    _locate_file(CONFIG_PATH)
     raise typer.Exit(code=exit_code)
 
 
+@cache
 def validate_config() -> None:
     """Validate the configuration file and ensure it is properly configured.
 
@@ -108,18 +177,20 @@ def validate_config() -> None:
     and is not using default values. This helps prevent runtime errors by ensuring the application
     is properly configured before execution.
 
+    A successful validation is cached for the life of the process; call
+    `validate_config.cache_clear()` to validate again.
+
     Raises:
         typer.Exit: If the config file is invalid, missing, or using defaults. Exit code 1.
             - Creates default config if missing
             - Displays validation errors if schema invalid
             - Prompts for edits if using default values
     """
-    # Create a default configuration file if one does not exist
-    if not CONFIG_PATH.exists():
-        create_default_config()
-
     try:
         validate_all_configs()
+    except FileNotFoundError:
+        # Create a default configuration file if one does not exist
+        edit_config(exit_code=1)
     except ValidationError as e:
         logger.error(f"Invalid configuration file: {CONFIG_PATH}")
         for error in e.errors():
@@ -128,11 +199,8 @@ def validate_config() -> None:
         raise typer.Exit(code=1) from e
 
     # Confirm we don't have a default configuration file
-    if (
-        not HalpConfig().file_globs
-        and not HalpConfig().file_exclude_regex
-        and not HalpConfig().categories
-    ):
+    config = HalpConfig()
+    if not config.file_globs and not config.file_exclude_regex and not config.categories:
         console.print(
             "Configuration file is using default values. Please edit the file before continuing.\nRun [code]halp --edit-config[/code] to open the file."
         )
@@ -18,6 +18,61 @@ STANDALONE_COMMENT = (
     NEWLINE.many() >> WS.optional() >> string("#") >> WS.optional() >> regex(r"[^\n\r]*")
 )
 
+# Quoted and unquoted values of aliases and exports.
+SINGLE_QUOTED_VALUE = regex(r"[^']+") << string("'")
+DOUBLE_QUOTED_VALUE = regex(r'[^"]+') << string('"')
+UNQUOTED_VALUE = regex(r"[^\s\n]+")
+
+# Grammar for aliases.
+ALIAS_IDENTIFIER = WS.optional() >> regex(r"alias", flags=re.IGNORECASE) << WS
+ALIAS_NAME = regex(r"[^=\s\\\$`]+") << string("=")
+
+# Grammar for exports.
+EXPORT_IDENTIFIER = WS.optional() >> regex(r"export", flags=re.IGNORECASE) << WS
+EXPORT_NAME = regex(r"[^=\s\"'\$\\`]+") << string("=")
+
+# Grammar for functions.
+FUNC_IDENTIFIER = WS.optional() >> regex(r"func(tion)?", flags=re.IGNORECASE).optional() << WS
+FUNC_NAME = WS.optional() >> regex(r"[\w-]+") << string("(")
+FUNC_ARGS = regex(r"[^)]*") << string(")")
+FUNC_SPACE = regex(r"[\s]+")
+FUNC_START = string("{")
+FUNC_BODY = regex(r".*?(?=[\s\n]\})", flags=re.DOTALL)
+FUNC_END = regex(r"[\s]\}")
+
+# Grammar for structured comments within a function body.
+FUNC_BODY_COMMENT = (
+    NEWLINE.many()
+    >> WS.optional()
+    >> string("#")
+    >> WS.optional()
+    >> (
+        regex(r"desc(ription)?", flags=re.IGNORECASE)
+        << WS.optional()
+        << regex(r"[-:=]")
+        << WS.optional()
+    ).optional()
+    >> regex(r"[^\n\r]*")
+)
+ANY_FURTHER_TEXT = regex(r".*", flags=re.DOTALL)
+
+# Match any line that does not start with 'alias', 'export', or 'function' and does not contain a function definition
+NOT_ALIAS = regex(r"(?!([ \t]*#.*?[\n\r])?[ \t]*alias)", flags=re.IGNORECASE).desc("not_alias")
+NOT_EXPORT = regex(r"(?!([ \t]*#.*?[\n\r])?[ \t]*export [\w-]+=)", flags=re.IGNORECASE).desc(
+    "not_export"
+)
+NOT_FUNCTION = regex(
+    r"(?!([ \t]*#.*?[\n\r])?[ \t]*(func(tion)? )?[\w-]+\(\))", flags=re.IGNORECASE
+).desc("not_function")
+NON_MATCHING_LINE = (
+    WS.optional() >> (NOT_ALIAS + NOT_EXPORT + NOT_FUNCTION) << regex(r".*") << NEWLINE
+).desc("non_matching_line")
+
+# Comment placements which read comments above or inline with a command. Built once rather than
+# as set literals evaluated on every parse.
+ABOVE_COMMENT_PLACEMENTS = frozenset({CommentPlacement.BEST, CommentPlacement.ABOVE})
+INLINE_COMMENT_PLACEMENTS = frozenset({CommentPlacement.INLINE, CommentPlacement.BEST})
+
 
 @generate
 def parse_alias() -> Generator[None, None, dict[str, str | None]]:
@@ -34,34 +89,30 @@ def parse_alias() -> Generator[None, None, dict[str, str | None]]:
         dict[str, str]: A dictionary containing 'name', 'code', and 'description' keys with corresponding
                         values extracted from the alias definition.
     """
-    # Grammar
-    alias_identifier = WS.optional() >> regex(r"alias", flags=re.IGNORECASE) << WS
-    alias_name = regex(r"[^=\s\\\$`]+") << string("=")
-
     # Parse
     above_comment = None
-    if HalpConfig().comment_placement in {CommentPlacement.BEST, CommentPlacement.ABOVE}:
+    if HalpConfig().comment_placement in ABOVE_COMMENT_PLACEMENTS:
         above_comment = yield STANDALONE_COMMENT.optional()
     else:
         yield STANDALONE_COMMENT.optional()
 
     yield NEWLINE.optional()
 
-    yield alias_identifier
-    name = yield alias_name
+    yield ALIAS_IDENTIFIER
+    name = yield ALIAS_NAME
 
     quotation = None
     quotation = yield QUOTE.optional()
 
     if quotation == "'":
-        value = yield regex(r"[^']+") << string("'")
+        value = yield SINGLE_QUOTED_VALUE
     elif quotation == '"':
-        value = yield regex(r'[^"]+') << string('"')
+        value = yield DOUBLE_QUOTED_VALUE
     elif quotation is None:
-        value = yield regex(r"[^\s\n]+")
+        value = yield UNQUOTED_VALUE
 
     inline_comment = None
-    if HalpConfig().comment_placement in {CommentPlacement.INLINE, CommentPlacement.BEST}:
+    if HalpConfig().comment_placement in INLINE_COMMENT_PLACEMENTS:
         inline_comment = yield COMMENT_ON_LINE.optional()
     else:
         yield COMMENT_ON_LINE.optional()
@@ -85,35 +136,31 @@ def parse_export() -> Generator[None, None, dict[str, str | None]]:
         dict[str, str]: A dictionary containing 'name', 'code', and 'description' keys with values
                         extracted from the export definition.
     """
-    # Grammar
-    export_identifier = WS.optional() >> regex(r"export", flags=re.IGNORECASE) << WS
-    export_name = regex(r"[^=\s\"'\$\\`]+") << string("=")
-
     # Parse
     yield NEWLINE.optional()
 
     above_comment = None
-    if HalpConfig().comment_placement in {CommentPlacement.BEST, CommentPlacement.ABOVE}:
+    if HalpConfig().comment_placement in ABOVE_COMMENT_PLACEMENTS:
         above_comment = yield STANDALONE_COMMENT.optional()
     else:
         yield STANDALONE_COMMENT.optional()
 
     yield NEWLINE.optional()
 
-    yield export_identifier
-    name = yield export_name
+    yield EXPORT_IDENTIFIER
+    name = yield EXPORT_NAME
 
     quotation = None
     quotation = yield QUOTE.optional()
     if quotation == "'":
-        value = yield regex(r"[^']+") << string("'")
+        value = yield SINGLE_QUOTED_VALUE
     elif quotation == '"':
-        value = yield regex(r'[^"]+') << string('"')
+        value = yield DOUBLE_QUOTED_VALUE
     else:
-        value = yield regex(r"[^\s\n]+")
+        value = yield UNQUOTED_VALUE
 
     inline_comment = None
-    if HalpConfig().comment_placement in {CommentPlacement.INLINE, CommentPlacement.BEST}:
+    if HalpConfig().comment_placement in INLINE_COMMENT_PLACEMENTS:
         inline_comment = yield COMMENT_ON_LINE.optional()
     else:
         yield COMMENT_ON_LINE.optional()
@@ -134,35 +181,27 @@ def parse_function() -> Generator[None, None, dict[str, str | None]]:
     Returns:
         dict[str, str]: A dictionary with 'name', 'args', 'code', and 'description' keys, representing the function's name, arguments, body, and comment respectively.
     """
-    # Grammar
-    func_identifier = WS.optional() >> regex(r"func(tion)?", flags=re.IGNORECASE).optional() << WS
-    func_name = WS.optional() >> regex(r"[\w-]+") << string("(")
-    func_args = regex(r"[^)]*") << string(")")
-    func_start = string("{")
-    func_body = regex(r".*?(?=[\s\n]\})", flags=re.DOTALL)
-    func_end = regex(r"[\s]\}")
-
     # Parse
     above_comment = None
-    if HalpConfig().comment_placement in {CommentPlacement.BEST, CommentPlacement.ABOVE}:
+    if HalpConfig().comment_placement in ABOVE_COMMENT_PLACEMENTS:
         above_comment = yield STANDALONE_COMMENT.optional()
     else:
         yield STANDALONE_COMMENT.optional()
 
     yield NEWLINE.optional()
 
-    yield func_identifier.optional()
-    name = yield func_name
-    args = yield func_args
-    yield regex(r"[\s]+").optional()
-    yield func_start
-    body = yield func_body
+    yield FUNC_IDENTIFIER.optional()
+    name = yield FUNC_NAME
+    args = yield FUNC_ARGS
+    yield FUNC_SPACE.optional()
+    yield FUNC_START
+    body = yield FUNC_BODY
 
     inline_comment = None
-    if HalpConfig().comment_placement in {CommentPlacement.INLINE, CommentPlacement.BEST}:
+    if HalpConfig().comment_placement in INLINE_COMMENT_PLACEMENTS:
         inline_comment = parse_function_body_comment.parse(body)
 
-    yield func_end
+    yield FUNC_END
 
     return {  # noqa: B901
         "name": name,
@@ -181,28 +220,18 @@ def parse_function_body_comment() -> Generator[None, None, str]:
     Returns:
         str: The comment found in the function body.
     """
-    # Grammar
-    structured_start = (
-        regex(r"desc(ription)?", flags=re.IGNORECASE)
-        << WS.optional()
-        << regex(r"[-:=]")
-        << WS.optional()
-    )
-    comment = (
-        NEWLINE.many()
-        >> WS.optional()
-        >> string("#")
-        >> WS.optional()
-        >> structured_start.optional()
-        >> regex(r"[^\n\r]*")
-    )
+    comment = yield FUNC_BODY_COMMENT.optional()
+    yield ANY_FURTHER_TEXT
 
-    any_further_text = regex(r".*", flags=re.DOTALL)
+    return comment  # noqa: B901
 
-    comment = yield comment.optional()
-    yield any_further_text
 
-    return comment  # noqa: B901
+# Match any command, tagged with its type
+TAGGED_COMMAND = (
+    parse_alias.tag(CommandType.ALIAS)
+    | parse_export.tag(CommandType.EXPORT)
+    | parse_function.tag(CommandType.FUNCTION)
+)
 
 
 @generate
@@ -218,30 +247,12 @@ def parse_file() -> Generator[None, None, dict[str, str | CommandType]]:
     Raises:
         ValueError: If the parser results are None.
     """
-    # Grammar
-
-    # Match any line that does not start with 'alias', 'export', or 'function' and does not contain a function definition
-    not_alias = regex(r"(?!([ \t]*#.*?[\n\r])?[ \t]*alias)", flags=re.IGNORECASE).desc("not_alias")
-    not_export = regex(r"(?!([ \t]*#.*?[\n\r])?[ \t]*export [\w-]+=)", flags=re.IGNORECASE).desc(
-        "not_export"
-    )
-    not_function = regex(
-        r"(?!([ \t]*#.*?[\n\r])?[ \t]*(func(tion)? )?[\w-]+\(\))", flags=re.IGNORECASE
-    ).desc("not_function")
-    non_matching_line = (
-        WS.optional() >> (not_alias + not_export + not_function) << regex(r".*") << NEWLINE
-    ).desc("non_matching_line")
-
     # Parse
-    yield non_matching_line.many().optional()
+    yield NON_MATCHING_LINE.many().optional()
     yield NEWLINE.optional()
 
     # Find matching commands
-    parser_results: tuple[CommandType, dict[str, str | CommandType]] | None = (
-        yield parse_alias.tag(CommandType.ALIAS)
-        | parse_export.tag(CommandType.EXPORT)
-        | parse_function.tag(CommandType.FUNCTION)
-    )
+    parser_results: tuple[CommandType, dict[str, str | CommandType]] | None = yield TAGGED_COMMAND
 
     # Add the tag to the result dictionary
     if parser_results is None:
@@ -251,7 +262,7 @@ def parse_file() -> Generator[None, None, dict[str, str | CommandType]]:
     result: dict[str, str | CommandType] = parser_results[1]
     result["command_type"] = parser_results[0]
 
-    yield non_matching_line.many().optional()
+    yield NON_MATCHING_LINE.many().optional()
     yield NEWLINE.optional()
 
     return result  # noqa: B901
@@ -4,13 +4,18 @@ import inflect
 from rich import box
 from rich.columns import Columns
 from rich.table import Table
+from rich.text import Text
 
 from halper.constants import CommandType
-from halper.models.database import Category, Command, CommandCategory
+from halper.models.database import Category, Command
 from halper.utils import console
 
 p = inflect.engine()
 
+# Command types as stored in the database, resolved once rather than per table row
+EXPORT_TYPE = CommandType.EXPORT.name
+CODE_AS_DESCRIPTION_TYPES = frozenset({CommandType.ALIAS.name, CommandType.EXPORT.name})
+
 
 def strings_to_columns(name: str, strings: list[str], equal: bool = True) -> Columns:
     """Convert a list of strings to a rich Columns object.
@@ -37,11 +42,12 @@ def display_commands(
         full_output: Whether to display full command information.
         found_in_tldr: Whether the command was found in tldr.
     """
-    show_id = len(commands) > 1
+    num_commands = len(commands)
+    show_id = num_commands > 1
 
     if show_id:
         console.print(
-            f"[bold]Found {len(commands)} commands matching:[/bold] [code]{input_string}[/code]"
+            f"[bold]Found {num_commands} commands matching:[/bold] [code]{input_string}[/code]"
         )
 
     for command in commands:
@@ -65,7 +71,7 @@ def command_list_table(
     show_categories: bool = False,
     full_output: bool = False,
     only_exports: bool = False,
-    title: str | None = None,
+    title: str | Text | None = None,
 ) -> Table | None:
     """List commands in a table, filtered and formatted based on the provided parameters.
 
@@ -76,23 +82,16 @@ def command_list_table(
         show_categories (bool): Whether to show categories.
         full_output (bool): Whether to show full output.
         only_exports (bool): Whether to show only export commands.
-        title (Optional[str]): A title for the table.
+        title (Optional[str | Text]): A title for the table.
 
     Returns:
         Optional[Table]: A 'rich' Table object containing the formatted command data, or None if no commands to display.
     """
-    commands_to_display = []
+    commands_to_display: list[Command] = []
 
     if category:
-        # Filter commands by category
-        commands_to_display = (
-            Command.select()
-            .where(Command.hidden == show_hidden)
-            .join(CommandCategory)
-            .join(Category)
-            .where(Category.id == category.id)
-            .order_by(Command.name)
-        )
+        # Filter commands by category, loading their files in the same query
+        commands_to_display = Command.by_category([category.id], hidden=show_hidden)[category.id]
 
     elif commands:
         # Use provided command list
@@ -123,22 +122,29 @@ def command_list_table(
         if display:
             table.add_column(name, style=style)
 
+    # Fetch categories for all commands at once rather than one query per row
+    category_names = (
+        Command.category_names_by_command([c.id for c in commands_to_display])
+        if show_categories
+        else {}
+    )
+
     for c in commands_to_display:
-        if only_exports and c.command_type != CommandType.EXPORT.name:
+        if only_exports and c.command_type != EXPORT_TYPE:
             continue
-        if not only_exports and not full_output and c.command_type == CommandType.EXPORT.name:
+        if not only_exports and not full_output and c.command_type == EXPORT_TYPE:
             continue
 
         description = (
             c.escaped_desc
             if c.description
             else c.code_syntax()
-            if c.command_type in {CommandType.ALIAS.name, CommandType.EXPORT.name}
+            if c.command_type in CODE_AS_DESCRIPTION_TYPES
             else ""
         )
         row_values = [
             c.name,
-            ", ".join(c.category_names),
+            ", ".join(category_names.get(c.id, [])),
             c.command_type.title() if full_output else "",
             description,
             str(c.id) if full_output or show_hidden else "",
@@ -1,7 +1,10 @@
 # type: ignore
 """Test halp CLI."""
 
+import os
 import re
+import subprocess  # noqa: S404
+import sys
 from unittest.mock import MagicMock
 
 import pytest
@@ -89,19 +92,22 @@ class TestCLI:
         # Given an empty database
         self._clear_test_data()
 
-        result = runner.invoke(app, [])
+        result = runner.invoke(app, ["--list"])
         assert result.exit_code == 1
         assert "No commands found" in strip_ansi(result.output)
 
     def test_fail_when_no_args(self, debug, mock_config):
         """Test the main command."""
-        # Given a populated database
-        self._populate_database()
+        # Given an empty database
+        self._clear_test_data()
 
         result = runner.invoke(app, [])
         assert result.exit_code == 1
         assert "No command specified" in strip_ansi(result.output)
 
+        # The database is not opened when there is nothing to do
+        Database.instantiate.assert_not_called()
+
     @pytest.mark.parametrize(
         ("repopulate", "args", "expected", "not_expected", "exit_code"),
         [
@@ -267,6 +273,50 @@ class TestCLI:
         assert "alias3    cat2         alias3        3" in strip_ansi(result.output)
         assert "alias2" not in strip_ansi(result.output)
 
+    def test_hide_commands_missing_id(self, debug, mock_config):
+        """Test hiding commands when one of the IDs does not exist."""
+        # Given a populated database
+        self._populate_database()
+
+        # WHEN hiding an existing and a missing command
+        result = runner.invoke(app, ["--hide", "1,999"])
+
+        # THEN the missing ID is reported and no command is hidden
+        assert result.exit_code == 1
+        assert "Command with ID 999 not found" in strip_ansi(result.output)
+        assert not Command.get_by_id(1).hidden
+
+    def test_hide_commands_duplicate_ids(self, debug, mock_config):
+        """Test hiding commands when an ID is given more than once."""
+        # Given a populated database
+        self._populate_database()
+
+        # WHEN hiding the same command twice
+        result = runner.invoke(app, ["--hide", "1,3,1"])
+
+        # THEN each command is only hidden once
+        assert result.exit_code == 0
+        assert strip_ansi(result.output).count("Command alias1 hidden") == 1
+        assert "Command alias3 hidden" in strip_ansi(result.output)
+
+    def test_search_name(self, debug, mock_config):
+        """Test searching command names with a regex."""
+        # Given a populated database
+        self._populate_database()
+
+        # WHEN searching names, THEN matching commands are listed
+        result = runner.invoke(app, ["--search-name", "^(alias1|func)"])
+        assert result.exit_code == 0
+        output = strip_ansi(result.output)
+        assert "alias1" in output
+        assert "func1" in output
+        assert "alias2" not in output
+
+        # WHEN the regex is invalid, THEN an error is shown
+        result = runner.invoke(app, ["--search-name", "alias("])
+        assert result.exit_code == 1
+        assert "Invalid regex" in strip_ansi(result.output)
+
     def test_unhide_commands(self, debug, mock_config):
         """Test unhiding commands."""
         # Given a populated database
@@ -342,3 +392,28 @@ class TestCLI:
         assert result.exit_code == 0
         cmd = Command.get(1)
         assert cmd.description == "this is a new description"
+
+
+@pytest.mark.parametrize("args", [["--index"], ["--list"], ["alias1"]])
+def test_cli_in_fresh_interpreter(tmp_path, fixtures, args):
+    """Run the CLI in a new process so the real import order is exercised."""
+    # Given a fresh home directory with a configuration indexing the fixture dotfiles
+    config_dir = tmp_path / "config" / "halp"
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.toml").write_text(f'file_globs = ["{fixtures}/dotfiles/*.bash"]\n')
+    env = os.environ | {
+        "HOME": str(tmp_path),
+        "XDG_CONFIG_HOME": str(tmp_path / "config"),
+        "XDG_DATA_HOME": str(tmp_path / "data"),
+        "XDG_STATE_HOME": str(tmp_path / "state"),
+        "XDG_CACHE_HOME": str(tmp_path / "cache"),
+    }
+    command = [sys.executable, "-c", "from halper.cli import app; app()"]
+    subprocess.run([*command, "--index"], env=env, capture_output=True, check=True)  # noqa: S603
+
+    # WHEN halp is run
+    result = subprocess.run([*command, *args], env=env, capture_output=True, text=True, check=False)  # noqa: S603
+
+    # THEN it completes without a traceback
+    assert "Traceback" not in result.stderr
+    assert result.returncode == 0
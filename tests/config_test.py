@@ -0,0 +1,193 @@
+# type: ignore
+"""Test loading the configuration file."""
+
+import pickle  # noqa: S403
+import re
+
+import pytest
+import tomllib
+import typer
+from confz import DataSource
+from pydantic import ValidationError
+
+from halper.config import HalpConfig
+from halper.config.config import CONFIG_CACHE_VERSION, CachedTomlSource, load_toml_cached
+from halper.utils import helpers
+
+
+def test_load_toml_cached_writes_cache(tmp_path):
+    """Verify parsing a TOML file writes a cache keyed to the file."""
+    # Given a TOML file and no cache
+    config_path = tmp_path / "config.toml"
+    config_path.write_text('file_globs = ["~/.bashrc"]\n')
+    cache_path = tmp_path / "cache" / "config.pickle"
+
+    # When the file is loaded
+    config = load_toml_cached(config_path, cache_path)
+
+    # Then the config is parsed and the cache is written
+    assert config == {"file_globs": ["~/.bashrc"]}
+    assert cache_path.exists()
+
+
+def test_load_toml_cached_uses_cache(tmp_path):
+    """Verify an unchanged TOML file is served from the cache."""
+    # Given a TOML file with a matching cache
+    config_path = tmp_path / "config.toml"
+    config_path.write_text('file_globs = ["~/.bashrc"]\n')
+    cache_path = tmp_path / "config.pickle"
+    st = config_path.stat()
+    with cache_path.open("wb") as f:
+        pickle.dump((CONFIG_CACHE_VERSION, st.st_mtime_ns, st.st_size), f)
+        pickle.dump({"file_globs": ["from_cache"]}, f)
+
+    # When the file is loaded
+    config = load_toml_cached(config_path, cache_path)
+
+    # Then the cached config is returned
+    assert config == {"file_globs": ["from_cache"]}
+
+
+def test_load_toml_cached_outdated_cache_version(tmp_path):
+    """Verify a cache written with another cache version is ignored."""
+    # Given a TOML file with a cache from an older cache version
+    config_path = tmp_path / "config.toml"
+    config_path.write_text('file_globs = ["~/.bashrc"]\n')
+    cache_path = tmp_path / "config.pickle"
+    st = config_path.stat()
+    with cache_path.open("wb") as f:
+        pickle.dump((CONFIG_CACHE_VERSION - 1, st.st_mtime_ns, st.st_size), f)
+        pickle.dump({"file_globs": ["from_cache"]}, f)
+
+    # When the file is loaded
+    config = load_toml_cached(config_path, cache_path)
+
+    # Then the TOML file is parsed
+    assert config == {"file_globs": ["~/.bashrc"]}
+
+
+def test_load_toml_cached_stale_cache(tmp_path):
+    """Verify a changed TOML file invalidates the cache."""
+    # Given a TOML file with a stale cache
+    config_path = tmp_path / "config.toml"
+    config_path.write_text('file_globs = ["~/.bashrc"]\n')
+    cache_path = tmp_path / "config.pickle"
+    with cache_path.open("wb") as f:
+        pickle.dump((CONFIG_CACHE_VERSION, 0, 0), f)
+        pickle.dump({"file_globs": ["from_cache"]}, f)
+
+    # When the file is loaded
+    config = load_toml_cached(config_path, cache_path)
+
+    # Then the TOML file is parsed
+    assert config == {"file_globs": ["~/.bashrc"]}
+
+
+def test_load_toml_cached_disabled(tmp_path, monkeypatch):
+    """Verify the cache is bypassed when HALP_NO_CONFIG_CACHE is set."""
+    # Given the cache is disabled
+    monkeypatch.setenv("HALP_NO_CONFIG_CACHE", "1")
+    config_path = tmp_path / "config.toml"
+    config_path.write_text("case_sensitive = true\n")
+    cache_path = tmp_path / "config.pickle"
+
+    # When the file is loaded
+    config = load_toml_cached(config_path, cache_path)
+
+    # Then no cache is written
+    assert config == {"case_sensitive": True}
+    assert not cache_path.exists()
+
+
+def test_config_is_loaded_once(tmp_path, mocker):
+    """Verify the configuration file is parsed once however many times HalpConfig is called."""
+    # Given a configuration file
+    config_path = tmp_path / "config.toml"
+    config_path.write_text("case_sensitive = true\n")
+    spy = mocker.spy(tomllib, "loads")
+
+    with HalpConfig.change_config_sources(
+        CachedTomlSource(file=config_path, cache_file=tmp_path / "config.pickle")
+    ):
+        # When the configuration is accessed repeatedly
+        configs = [HalpConfig() for _ in range(5)]
+
+        # Then the same instance is returned and the file is parsed once
+        assert all(config is configs[0] for config in configs)
+        assert configs[0].case_sensitive is True
+        assert spy.call_count == 1
+
+
+def test_create_default_config(tmp_path, monkeypatch):
+    """Verify the default configuration is only created when none exists."""
+    # Given no configuration file in a directory which does not exist
+    config_path = tmp_path / "halp" / "config.toml"
+    monkeypatch.setattr(helpers, "CONFIG_PATH", config_path)
+
+    # When the default configuration is created twice
+    # Then it is created the first time only
+    assert helpers.create_default_config() is True
+    assert config_path.read_bytes() == helpers.PATH_CONFIG_DEFAULT.read_bytes()
+    assert helpers.create_default_config() is False
+
+
+def test_edit_config_falls_back_to_typer_launch(tmp_path, monkeypatch, mocker):
+    """Verify the configuration is opened with typer.launch when the launcher can not spawn."""
+    # Given an existing configuration file and a launcher which can not be started
+    config_path = tmp_path / "config.toml"
+    config_path.write_text("case_sensitive = true\n")
+    monkeypatch.setattr(helpers, "CONFIG_PATH", config_path)
+    mocker.patch.object(helpers.subprocess, "Popen", side_effect=OSError)
+    launch = mocker.patch.object(helpers.typer, "launch")
+
+    # When the configuration is edited
+    with pytest.raises(typer.Exit) as e:
+        helpers.edit_config()
+
+    # Then typer.launch is used and the program exits cleanly
+    launch.assert_called_once_with(str(config_path), locate=True)
+    assert e.value.exit_code == 0
+
+
+def test_validate_config_runs_once(mocker):
+    """Verify a successful validation is not repeated within the same process."""
+    # Given a configuration which validates
+    helpers.validate_config.cache_clear()
+    spy = mocker.patch.object(helpers, "validate_all_configs")
+    mocker.patch.object(
+        helpers,
+        "HalpConfig",
+        return_value=mocker.Mock(file_globs=("~/.bashrc",), file_exclude_regex="", categories={}),
+    )
+
+    # When the configuration is validated twice
+    helpers.validate_config()
+    helpers.validate_config()
+
+    # Then the configuration is only validated once
+    assert spy.call_count == 1
+    helpers.validate_config.cache_clear()
+
+
+def test_compiled_patterns():
+    """Verify user-supplied regexes are compiled with the configured case sensitivity."""
+    # Given a configuration with an ignore regex and no exclude regex
+    with HalpConfig.change_config_sources(
+        DataSource(data={"command_name_ignore_regex": "^_", "case_sensitive": False})
+    ):
+        config = HalpConfig()
+
+        # Then the ignore regex is compiled once, ignoring case, and the exclude pattern is None
+        assert config.command_name_ignore_pattern.flags & re.IGNORECASE
+        assert config.command_name_ignore_pattern is config.command_name_ignore_pattern
+        assert config.file_exclude_pattern is None
+
+
+def test_category_config_rejects_unknown_keys():
+    """Verify a misspelled category key fails validation instead of being ignored."""
+    # Given a category with a misspelled regex key
+    source = DataSource(data={"categories": {"git": {"name": "git", "code_regexx": "git"}}})
+
+    # Then loading the configuration fails
+    with HalpConfig.change_config_sources(source), pytest.raises(ValidationError):
+        HalpConfig()
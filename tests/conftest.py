@@ -17,10 +17,6 @@ from halper.models import (
     CommandCategory,
     File,
     HalpInfo,
-    TempCategory,
-    TempCommand,
-    TempCommandCategory,
-    TempFile,
 )
 
 # IMPORTANT: The MODELS list must be kept in sync with all the models defined in sr/models/database.py otherwise tests will write to the wrong database.
@@ -29,10 +25,6 @@ MODELS = [
     Category,
     CommandCategory,
     File,
-    TempFile,
-    TempCommand,
-    TempCategory,
-    TempCommandCategory,
     HalpInfo,
 ]
 FIXTURE_CONFIG = Path(__file__).resolve().parent / "fixtures/configs/default_test_config.toml"